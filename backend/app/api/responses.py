@@ -0,0 +1,15 @@
+"""Response helpers shared by API routes."""
+
+from fastapi.responses import Response
+from pydantic import BaseModel
+
+
+def json_response(model: BaseModel) -> Response:
+    """
+    Serialize a response model straight to JSON bytes.
+
+    pydantic-core encodes the model (datetimes included) in one pass, skipping
+    FastAPI's response_model re-validation and jsonable_encoder walk. The
+    route's response_model still documents the schema.
+    """
+    return Response(content=model.model_dump_json(), media_type="application/json")
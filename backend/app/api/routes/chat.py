@@ -1,15 +1,23 @@
 """Chat session and message API routes."""
 
 import io
+import time
+import asyncio
 import zipfile
+import functools
 import base64
+import shlex
+import logging
+import posixpath
 import mimetypes
 from datetime import datetime
-from typing import List, Optional
+from pathlib import Path
+from typing import AsyncIterator, Iterable, List, Optional
 from fastapi import APIRouter, Depends, HTTPException, status, WebSocket
-from fastapi.responses import StreamingResponse, Response
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, func
+from sqlalchemy.orm import raiseload
 from pydantic import BaseModel
 
 from app.core.storage.database import get_db
@@ -24,9 +32,13 @@ from app.models.schemas import (
     ContentBlockResponse,
     ContentBlockListResponse,
 )
+from app.api.responses import json_response
 from app.api.websocket import ChatWebSocketHandler
 from app.core.sandbox import get_container_manager
 from app.core.storage.storage_factory import get_storage
+from app.core.storage.workspace_storage import FileStream, READ_CHUNK_SIZE
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/chats", tags=["chat"])
 
@@ -59,24 +71,37 @@ async def list_chat_sessions(
     db: AsyncSession = Depends(get_db),
 ):
     """List chat sessions, optionally filtered by project."""
-    query = select(ChatSession)
-
-    if project_id:
-        query = query.where(ChatSession.project_id == project_id)
-
-    # Get total count
-    count_query = select(func.count()).select_from(query.subquery())
-    total_result = await db.execute(count_query)
-    total = total_result.scalar_one()
-
-    # Get chat sessions
-    query = query.offset(skip).limit(limit).order_by(ChatSession.created_at.desc())
-    result = await db.execute(query)
-    sessions = result.scalars().all()
+    filters = [ChatSession.project_id == project_id] if project_id else []
+
+    # Get chat sessions with the total count as a window column (one round trip)
+    page_query = (
+        select(ChatSession, func.count().over().label("total_count"))
+        # Responses only read columns; raiseload makes any accidental lazy load
+        # fail loudly instead of issuing one query per row
+        .options(raiseload("*"))
+        .where(*filters)
+        .offset(skip)
+        .limit(limit)
+        .order_by(ChatSession.created_at.desc())
+    )
+    result = await db.execute(page_query)
+    rows = result.all()
+    sessions = [row.ChatSession for row in rows]
+
+    if rows:
+        total = rows[0].total_count
+    elif skip or limit <= 0:
+        # Page is past the end (or empty by request), so the window column is unavailable
+        count_query = select(func.count(ChatSession.id)).where(*filters)
+        total = (await db.execute(count_query)).scalar_one()
+    else:
+        total = 0
 
-    return ChatSessionListResponse(
-        chat_sessions=[ChatSessionResponse.model_validate(s) for s in sessions],
-        total=total,
+    return json_response(
+        ChatSessionListResponse(
+            chat_sessions=[ChatSessionResponse.from_orm_fast(s) for s in sessions],
+            total=total,
+        )
     )
 
 
@@ -104,8 +129,9 @@ async def create_chat_session(
         name=session_data.name,
     )
     db.add(session)
+    # All column defaults are client-side, so the flush populates every field
+    # and the session does not expire on commit: no refresh SELECT is needed.
     await db.commit()
-    await db.refresh(session)
 
     return ChatSessionResponse.model_validate(session)
 
@@ -151,8 +177,8 @@ async def update_chat_session(
     for field, value in update_data.items():
         setattr(session, field, value)
 
+    # updated_at is set client-side on flush and nothing expires on commit
     await db.commit()
-    await db.refresh(session)
 
     return ChatSessionResponse.model_validate(session)
 
@@ -179,7 +205,7 @@ async def delete_chat_session(
         await container_manager.destroy_container(session_id)
     except Exception as e:
         # Log but don't fail - container cleanup is best-effort
-        print(f"Warning: Failed to cleanup container for session {session_id}: {e}")
+        logger.warning("Failed to cleanup container for session %s: %s", session_id, e)
 
     await db.delete(session)
     await db.commit()
@@ -191,6 +217,7 @@ async def list_content_blocks(
     session_id: str,
     skip: int = 0,
     limit: int = 500,
+    after_seq: int | None = None,
     db: AsyncSession = Depends(get_db),
 ):
     """
@@ -199,41 +226,61 @@ async def list_content_blocks(
     This is the new unified API that replaces the separate messages + agent_actions model.
     Each content block represents a single piece of content (text, tool call, or tool result)
     with guaranteed ordering via sequence_number.
+
+    Pass the previous page's next_after_seq as after_seq to page by sequence number
+    (keyset pagination) instead of skip, which still has to scan the skipped rows.
     """
-    # Verify session exists
-    session_query = select(ChatSession).where(ChatSession.id == session_id)
-    session_result = await db.execute(session_query)
-    session = session_result.scalar_one_or_none()
+    session_filter = ContentBlock.chat_session_id == session_id
+
+    # Get content blocks ordered by sequence_number, with the session total as an
+    # extra column so both come back in one round trip
+    if after_seq is None:
+        query = (
+            select(ContentBlock, func.count().over().label("total_count"))
+            .where(session_filter)
+            .offset(skip)
+        )
+    else:
+        # A window count would only see the rows after the cursor
+        total_subquery = select(func.count()).where(session_filter).scalar_subquery()
+        query = select(ContentBlock, total_subquery.label("total_count")).where(
+            session_filter, ContentBlock.sequence_number > after_seq
+        )
+    query = (
+        query.options(raiseload("*")).order_by(ContentBlock.sequence_number.asc()).limit(limit)
+    )
+    result = await db.execute(query)
+    rows = result.all()
+    blocks = [row.ContentBlock for row in rows]
+
+    if rows:
+        total = rows[0].total_count
+    elif skip or after_seq is not None or limit <= 0:
+        # Page is past the end (or empty by request), so the total column is unavailable
+        total = await db.scalar(
+            select(func.count()).select_from(ContentBlock).where(session_filter)
+        )
+    else:
+        total = 0
 
-    if not session:
+    # Only an empty session can be a missing one, so the existence check is
+    # skipped whenever blocks were found
+    if total == 0 and not await db.scalar(
+        select(ChatSession.id).where(ChatSession.id == session_id)
+    ):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Chat session with id {session_id} not found",
         )
 
-    # Get total count
-    count_query = (
-        select(func.count())
-        .select_from(ContentBlock)
-        .where(ContentBlock.chat_session_id == session_id)
-    )
-    total_result = await db.execute(count_query)
-    total = total_result.scalar_one()
-
-    # Get content blocks ordered by sequence_number
-    query = (
-        select(ContentBlock)
-        .where(ContentBlock.chat_session_id == session_id)
-        .order_by(ContentBlock.sequence_number.asc())
-        .offset(skip)
-        .limit(limit)
-    )
-    result = await db.execute(query)
-    blocks = result.scalars().all()
-
-    return ContentBlockListResponse(
-        blocks=[ContentBlockResponse.model_validate(b) for b in blocks],
-        total=total,
+    return json_response(
+        ContentBlockListResponse(
+            blocks=[ContentBlockResponse.from_orm_fast(b) for b in blocks],
+            total=total,
+            next_after_seq=(
+                blocks[-1].sequence_number if blocks and len(blocks) == limit else None
+            ),
+        )
     )
 
 
@@ -272,6 +319,17 @@ async def chat_stream(
 
 
 # Workspace file endpoints
+
+# Load the MIME type database at import instead of on the first request
+mimetypes.init()
+
+
+@functools.lru_cache(maxsize=1024)
+def _guess_mime_type(name: str) -> Optional[str]:
+    """Guess a MIME type from a file name (cached, extensions repeat constantly)."""
+    return mimetypes.guess_type(name)[0]
+
+
 async def _get_container_for_session(session_id: str, raise_if_not_found: bool = True):
     """Helper to get container for a session."""
     manager = get_container_manager()
@@ -295,8 +353,8 @@ async def _list_files_from_storage(
         file_infos = await storage.list_files(session_id, directory)
         for info in file_infos:
             # info.path is full path like /workspace/out/file.py
-            name = info.path.split("/")[-1]
-            mime_type, _ = mimetypes.guess_type(name)
+            name = info.path.rpartition("/")[2]
+            mime_type = _guess_mime_type(name)
             files.append(
                 WorkspaceFile(
                     name=name,
@@ -306,8 +364,8 @@ async def _list_files_from_storage(
                     mime_type=mime_type,
                 )
             )
-    except Exception as e:
-        print(f"Error listing files from storage: {e}")
+    except Exception:
+        logger.exception("Error listing files from storage")
 
     return files
 
@@ -318,27 +376,22 @@ async def _list_files_in_directory(
     """List files in a directory within the container."""
     files = []
 
-    # Use find command to list files with size
-    cmd = f"find {directory} -maxdepth 1 -type f -printf '%f\\t%s\\n' 2>/dev/null || true"
+    # NUL-separated path/size records, safe for names containing tabs or newlines
+    cmd = f"find {directory} -maxdepth 1 -type f -printf '%p\\0%s\\0' 2>/dev/null || true"
     exit_code, stdout, stderr = await container.execute(cmd, workdir="/workspace", timeout=10)
 
-    if stdout.strip():
-        for line in stdout.strip().split("\n"):
-            if "\t" in line:
-                parts = line.split("\t")
-                name = parts[0]
-                size = int(parts[1]) if len(parts) > 1 and parts[1].isdigit() else 0
-                path = f"{directory}/{name}"
-                mime_type, _ = mimetypes.guess_type(name)
-                files.append(
-                    WorkspaceFile(
-                        name=name,
-                        path=path,
-                        size=size,
-                        type=file_type,
-                        mime_type=mime_type,
-                    )
-                )
+    fields = stdout.split("\0")
+    for path, size_str in zip(fields[0::2], fields[1::2]):
+        name = path.rpartition("/")[2]
+        files.append(
+            WorkspaceFile(
+                name=name,
+                path=path,
+                size=int(size_str) if size_str.isdigit() else 0,
+                type=file_type,
+                mime_type=_guess_mime_type(name),
+            )
+        )
 
     return files
 
@@ -385,18 +438,66 @@ async def list_workspace_files(session_id: str, db: AsyncSession = Depends(get_d
     return WorkspaceFilesResponse(uploaded=uploaded, output=output)
 
 
-async def _read_file_content(session_id: str, path: str, db: AsyncSession = None) -> str:
-    """Read file content from container, storage backend, or project file storage."""
-    # Validate path is within workspace
-    if not path.startswith("/workspace/"):
+def _normalize_workspace_path(path: str) -> str:
+    """
+    Normalize a client-supplied path and ensure it stays inside /workspace/.
+
+    Rejects any ``..`` segment outright rather than resolving it, so a path is
+    either used as given (minus redundant slashes and ``.``) or refused with 400
+    before any container or storage work is done.
+    """
+    normalized = posixpath.normpath(path)
+    if (
+        not normalized.startswith("/workspace/")
+        or ".." in path.split("/")
+        or "\0" in path
+    ):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Path must be within /workspace/",
         )
+    return normalized
+
+
+async def _iter_bytes(data: bytes) -> AsyncIterator[bytes]:
+    """Wrap already-read bytes as a one-chunk stream."""
+    yield data
+
+
+async def _iter_path_chunks(file_path: Path) -> AsyncIterator[bytes]:
+    """Stream a host file in chunks without blocking the event loop."""
+    f = await asyncio.to_thread(file_path.open, "rb")
+    try:
+        while chunk := await asyncio.to_thread(f.read, READ_CHUNK_SIZE):
+            yield chunk
+    finally:
+        f.close()
+
+
+async def _read_file_bytes(
+    session_id: str, path: str, db: AsyncSession = None
+) -> tuple[bytes, Optional[str]]:
+    """Read raw file bytes and MIME type from project file storage, container, or storage."""
+    chunks, mime_type = await _open_file_stream(session_id, path, db)
+    return b"".join([chunk async for chunk in chunks]), mime_type
+
+
+async def _open_file_stream(
+    session_id: str, path: str, db: AsyncSession = None
+) -> tuple[FileStream, Optional[str]]:
+    """
+    Open a file from project file storage, container, or storage for streaming.
+
+    Missing files raise HTTPException here rather than during iteration, so
+    callers can still return a proper error response. Disk and storage files
+    are read in chunks; container files arrive whole from the archive API.
+    The stream carries the file size whenever the source reports it.
+    """
+    path = _normalize_workspace_path(path)
 
     # Handle project files (uploaded files) - read from file manager on disk
     if path.startswith("/workspace/project_files/") and db:
-        filename = path.split("/")[-1]
+        filename = path.rpartition("/")[2]
 
         # Get session to find project_id
         session_query = select(ChatSession).where(ChatSession.id == session_id)
@@ -432,15 +533,10 @@ async def _read_file_content(session_id: str, path: str, db: AsyncSession = None
                 detail=f"File not found on disk: {path}",
             )
 
-        # Read file content
-        mime_type = file_record.mime_type or mimetypes.guess_type(filename)[0]
-        content_bytes = file_path.read_bytes()
+        mime_type = file_record.mime_type or _guess_mime_type(filename)
+        return FileStream(_iter_path_chunks(file_path), file_path.stat().st_size), mime_type
 
-        if mime_type and mime_type.startswith("image/"):
-            b64_content = base64.b64encode(content_bytes).decode("utf-8")
-            return f"data:{mime_type};base64,{b64_content}"
-        else:
-            return content_bytes.decode("utf-8")
+    mime_type = _guess_mime_type(path)
 
     # Try container first for output files
     container = await _get_container_for_session(session_id, raise_if_not_found=False)
@@ -448,7 +544,7 @@ async def _read_file_content(session_id: str, path: str, db: AsyncSession = None
     if container:
         # Check if file exists
         exit_code, _, _ = await container.execute(
-            f"test -f '{path}'", workdir="/workspace", timeout=5
+            f"test -f {shlex.quote(path)}", workdir="/workspace", timeout=5
         )
         if exit_code != 0:
             raise HTTPException(
@@ -456,29 +552,18 @@ async def _read_file_content(session_id: str, path: str, db: AsyncSession = None
                 detail=f"File not found: {path}",
             )
 
-        content = await container.read_file(path)
-        if content is None:
+        content_bytes = await container.read_file_bytes(path)
+        if content_bytes is None:
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail="Failed to read file content",
             )
-        return content
+        return FileStream(_iter_bytes(content_bytes), len(content_bytes)), mime_type
     else:
         # Fall back to storage backend
         storage = get_storage()
         try:
-            content_bytes = await storage.read_file(session_id, path)
-            # Check if it's binary (image, etc.)
-            mime_type, _ = mimetypes.guess_type(path)
-            if mime_type and mime_type.startswith("image/"):
-                # Return as base64 data URI
-                import base64 as b64
-
-                b64_content = b64.b64encode(content_bytes).decode("utf-8")
-                return f"data:{mime_type};base64,{b64_content}"
-            else:
-                # Return as text
-                return content_bytes.decode("utf-8")
+            return await storage.open_file(session_id, path), mime_type
         except FileNotFoundError:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -491,6 +576,25 @@ async def _read_file_content(session_id: str, path: str, db: AsyncSession = None
             )
 
 
+async def _read_file_content(session_id: str, path: str, db: AsyncSession = None) -> str:
+    """
+    Read file content as text, or as a base64 data URI for binary files.
+
+    Only used where the content is embedded in JSON; downloads use
+    _read_file_bytes directly to avoid the base64 round trip.
+    """
+    content_bytes, mime_type = await _read_file_bytes(session_id, path, db)
+
+    if not (mime_type and mime_type.startswith("image/")):
+        try:
+            return content_bytes.decode("utf-8")
+        except UnicodeDecodeError:
+            pass
+
+    b64_content = base64.b64encode(content_bytes).decode("utf-8")
+    return f"data:{mime_type or 'application/octet-stream'};base64,{b64_content}"
+
+
 @router.get("/{session_id}/workspace/files/content")
 async def get_workspace_file_content(
     session_id: str, path: str, db: AsyncSession = Depends(get_db)
@@ -500,7 +604,7 @@ async def get_workspace_file_content(
 
     # Determine if it's a binary file (data URI)
     is_binary = content.startswith("data:")
-    mime_type, _ = mimetypes.guess_type(path)
+    mime_type = _guess_mime_type(path)
 
     return {
         "path": path,
@@ -513,34 +617,59 @@ async def get_workspace_file_content(
 @router.get("/{session_id}/workspace/files/download")
 async def download_workspace_file(session_id: str, path: str, db: AsyncSession = Depends(get_db)):
     """Download a single workspace file."""
-    content = await _read_file_content(session_id, path, db)
+    stream, mime_type = await _open_file_stream(session_id, path, db)
 
-    # Get filename and mime type
-    filename = path.split("/")[-1]
-    mime_type, _ = mimetypes.guess_type(filename)
+    filename = path.rpartition("/")[2]
     mime_type = mime_type or "application/octet-stream"
 
-    # Handle binary files (data URIs)
-    if content.startswith("data:"):
-        # Extract base64 content
-        try:
-            header, b64_data = content.split(",", 1)
-            file_bytes = base64.b64decode(b64_data)
-        except Exception:
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail="Failed to decode file content",
-            )
-    else:
-        file_bytes = content.encode("utf-8")
+    headers = {"Content-Disposition": f'attachment; filename="{filename}"'}
+    if stream.size is not None:
+        # Lets browsers show download progress
+        headers["Content-Length"] = str(stream.size)
+
+    return StreamingResponse(stream, media_type=mime_type, headers=headers)
 
-    return Response(
-        content=file_bytes,
-        media_type=mime_type,
-        headers={
-            "Content-Disposition": f'attachment; filename="{filename}"',
-        },
-    )
+
+class _ZipChunkSink(io.RawIOBase):
+    """Write-only stream that collects what zipfile writes until drained."""
+
+    def __init__(self):
+        self._chunks: List[bytes] = []
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, b) -> int:
+        self._chunks.append(bytes(b))
+        return len(b)
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+# Already-compressed formats gain nothing from DEFLATE
+_PRECOMPRESSED_MIME_TYPES = frozenset(
+    {
+        "application/zip",
+        "application/gzip",
+        "application/x-bzip2",
+        "application/x-xz",
+        "application/x-7z-compressed",
+        "application/x-rar-compressed",
+    }
+)
+
+
+def _zip_compress_type(mime_type: Optional[str]) -> int:
+    """Pick the zip compression method for a file of the given MIME type."""
+    if mime_type and (
+        mime_type in _PRECOMPRESSED_MIME_TYPES
+        or (mime_type.startswith(("image/", "audio/", "video/")) and mime_type != "image/svg+xml")
+    ):
+        return zipfile.ZIP_STORED
+    return zipfile.ZIP_DEFLATED
 
 
 @router.get("/{session_id}/workspace/download-all")
@@ -548,6 +677,11 @@ async def download_all_workspace_files(
     session_id: str, type: str = "output", db: AsyncSession = Depends(get_db)
 ):
     """Download all files of a type as a zip archive."""
+    # Uploaded files are read straight from the file manager; the archive is
+    # streamed after this handler returns, so it must not touch the DB session
+    disk_paths: dict[str, Optional[Path]] = {}
+    container = None
+
     if type == "uploaded":
         # Get uploaded files from database (project files)
         session_query = select(ChatSession).where(ChatSession.id == session_id)
@@ -574,6 +708,11 @@ async def download_all_workspace_files(
             )
             for f in project_files
         ]
+        file_manager = get_file_manager()
+        disk_paths = {
+            f"/workspace/project_files/{f.filename}": file_manager.get_file_path(f.file_path)
+            for f in project_files
+        }
     elif type == "output":
         directory = "/workspace/out"
         # Try to get running container
@@ -595,32 +734,78 @@ async def download_all_workspace_files(
             detail=f"No {type} files found",
         )
 
-    # Create zip file in memory
-    zip_buffer = io.BytesIO()
-    with zipfile.ZipFile(zip_buffer, "w", zipfile.ZIP_DEFLATED) as zip_file:
-        for file in files:
+    async def _open_zip_entry(file: WorkspaceFile) -> Optional[AsyncIterator[bytes]]:
+        if file.path in disk_paths:
+            file_path = disk_paths[file.path]
+            if not file_path or not file_path.exists():
+                return None
+            return _iter_path_chunks(file_path)
+
+        chunks, _ = await _open_file_stream(session_id, file.path)
+        return chunks
+
+    async def _iter_entries(entry_files: Iterable[WorkspaceFile]):
+        for file in entry_files:
             try:
-                content = await _read_file_content(session_id, file.path, db)
-                if content:
-                    # Handle binary files (data URIs)
-                    if content.startswith("data:"):
-                        try:
-                            header, b64_data = content.split(",", 1)
-                            file_bytes = base64.b64decode(b64_data)
-                        except Exception:
-                            continue
-                    else:
-                        file_bytes = content.encode("utf-8")
-
-                    zip_file.writestr(file.name, file_bytes)
+                chunks = await _open_zip_entry(file)
             except HTTPException:
                 # Skip files that can't be read
                 continue
-
-    zip_buffer.seek(0)
+            if chunks is not None:
+                yield file, chunks
+
+    async def _iter_container_entries():
+        # One archive request for the whole directory instead of an exec and a
+        # read per file
+        listed = {f.name: f for f in files}
+        entries = container.iter_directory_files(directory)
+        try:
+            while True:
+                try:
+                    entry = await asyncio.to_thread(next, entries, None)
+                except Exception:
+                    logger.warning(
+                        "Reading %s as one archive failed; reading files individually",
+                        directory,
+                        exc_info=True,
+                    )
+                    break
+                if entry is None:
+                    return
+                name, file_bytes = entry
+                file = listed.pop(name, None)
+                if file is not None:
+                    yield file, _iter_bytes(file_bytes)
+        finally:
+            entries.close()
+
+        # Fall back to per-file reads for whatever the archive didn't deliver,
+        # skipping unreadable files as before
+        async for item in _iter_entries(listed.values()):
+            yield item
+
+    async def _iter_zip():
+        # Emit compressed data as each chunk is written, so the download starts
+        # immediately and memory stays bounded by one chunk (one file for
+        # container entries) regardless of file size
+        sink = _ZipChunkSink()
+        entries = _iter_container_entries() if container else _iter_entries(files)
+        with zipfile.ZipFile(sink, "w", zipfile.ZIP_DEFLATED) as zip_file:
+            async for file, chunks in entries:
+                zip_info = zipfile.ZipInfo(file.name, date_time=time.localtime()[:6])
+                zip_info.compress_type = _zip_compress_type(file.mime_type)
+                zip_info.external_attr = 0o600 << 16
+                # The size isn't known until the entry is written, so always use
+                # zip64 headers; otherwise entries past 2 GiB fail on close
+                with zip_file.open(zip_info, "w", force_zip64=True) as entry:
+                    async for chunk in chunks:
+                        entry.write(chunk)
+                        yield sink.drain()
+                yield sink.drain()
+        yield sink.drain()
 
     return StreamingResponse(
-        zip_buffer,
+        _iter_zip(),
         media_type="application/zip",
         headers={
             "Content-Disposition": f'attachment; filename="{type}_files.zip"',
@@ -650,6 +835,7 @@ async def upload_workspace_file_to_project(
     project_id = request.project_id
 
     # Validate path is an output file
+    path = _normalize_workspace_path(path)
     if not path.startswith("/workspace/out/"):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -674,29 +860,12 @@ async def upload_workspace_file_to_project(
         )
 
     # Read file content from workspace
-    try:
-        content = await _read_file_content(session_id, path, db)
-    except HTTPException:
-        raise
+    file_bytes, mime_type = await _read_file_bytes(session_id, path, db)
 
     # Get filename
-    filename = path.split("/")[-1]
-    mime_type, _ = mimetypes.guess_type(filename)
+    filename = path.rpartition("/")[2]
     mime_type = mime_type or "application/octet-stream"
 
-    # Handle binary files (data URIs)
-    if content.startswith("data:"):
-        try:
-            header, b64_data = content.split(",", 1)
-            file_bytes = base64.b64decode(b64_data)
-        except Exception:
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail="Failed to decode file content",
-            )
-    else:
-        file_bytes = content.encode("utf-8")
-
     # Check if file already exists in project
     existing_query = select(File).where(File.project_id == project_id, File.filename == filename)
     existing_result = await db.execute(existing_query)
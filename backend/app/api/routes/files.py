@@ -2,9 +2,11 @@
 
 from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File as FastAPIFile
 from fastapi.responses import FileResponse
+from pydantic import TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 
+from app.api.responses import json_response
 from app.core.storage.database import get_db
 from app.models.database import File, FileType, Project
 from app.models.schemas.file import FileResponse as FileSchema, FileListResponse
@@ -15,6 +17,10 @@ from app.core.sandbox import is_allowed_file
 
 router = APIRouter(prefix="/files", tags=["files"])
 
+# Built at import so listing files reuses one validator for every row; the route
+# returns through json_response so the rows are not validated a second time
+_FILES_ADAPTER = TypeAdapter(list[FileSchema])
+
 
 @router.post("/upload/{project_id}", response_model=FileSchema, status_code=status.HTTP_201_CREATED)
 async def upload_file(
@@ -102,9 +108,11 @@ async def list_project_files(
     total_result = await db.execute(count_query)
     total = total_result.scalar_one()
 
-    return FileListResponse(
-        files=[FileSchema.model_validate(f) for f in files],
-        total=total,
+    return json_response(
+        FileListResponse(
+            files=_FILES_ADAPTER.validate_python(files, from_attributes=True),
+            total=total,
+        )
     )
 
 
@@ -1,9 +1,11 @@
 """Project API routes."""
 
 from fastapi import APIRouter, Depends, HTTPException, status
+from pydantic import TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, func
 
+from app.api.responses import json_response
 from app.core.storage.database import get_db
 from app.models.database import Project, AgentConfiguration, ChatSession
 from app.models.schemas import (
@@ -23,6 +25,10 @@ from app.core.storage.file_manager import get_file_manager
 
 router = APIRouter(prefix="/projects", tags=["projects"])
 
+# Validates a whole page of ORM rows in one call instead of per-row model_validate;
+# the route returns through json_response so the page is not validated again
+_PROJECTS_ADAPTER = TypeAdapter(list[ProjectResponse])
+
 
 @router.get("", response_model=ProjectListResponse)
 async def list_projects(
@@ -41,9 +47,11 @@ async def list_projects(
     result = await db.execute(query)
     projects = result.scalars().all()
 
-    return ProjectListResponse(
-        projects=[ProjectResponse.model_validate(p) for p in projects],
-        total=total,
+    return json_response(
+        ProjectListResponse(
+            projects=_PROJECTS_ADAPTER.validate_python(projects, from_attributes=True),
+            total=total,
+        )
     )
 
 
@@ -399,7 +407,9 @@ async def list_project_chat_sessions(
     result = await db.execute(query)
     sessions = result.scalars().all()
 
-    return ChatSessionListResponse(
-        chat_sessions=[ChatSessionResponse.model_validate(s) for s in sessions],
-        total=total,
+    return json_response(
+        ChatSessionListResponse(
+            chat_sessions=[ChatSessionResponse.from_orm_fast(s) for s in sessions],
+            total=total,
+        )
     )
@@ -1,7 +1,9 @@
 """WebSocket handler for chat streaming with agent support."""
 
+import re
 import json
 import asyncio
+import functools
 from dataclasses import dataclass
 from typing import Dict, Any, Optional
 from fastapi import WebSocket, WebSocketDisconnect
@@ -16,6 +18,7 @@ from app.models.database import (
     ContentBlockAuthor,
 )
 from sqlalchemy import func
+from app.core.config import settings
 from app.core.llm import create_llm_provider_with_db
 from app.core.storage.database import AsyncSessionLocal
 from app.core.agent.executor import ReActAgent
@@ -32,6 +35,7 @@ from app.core.agent.tools import (
 from app.core.sandbox.manager import get_container_manager
 from app.api.websocket.task_registry import get_agent_task_registry
 from app.api.websocket.streaming_manager import streaming_manager
+from app.api.websocket.chunk_batcher import ChunkBatcher
 from collections import deque
 
 # Import new architectural services
@@ -100,6 +104,36 @@ def create_orchestrator(db: AsyncSession) -> MessageOrchestrator:
     )
 
 
+# One case-insensitive pass over the model name instead of a lowered copy and
+# a substring scan per family
+_VISION_MODEL_RE = re.compile(
+    r"gpt-4(?:o|-turbo|-vision)"  # OpenAI vision models
+    r"|claude-(?:3|sonnet|opus|haiku)"  # Anthropic Claude 3+ models (all support vision)
+    r"|gemini.*(?:vision|pro)|(?:vision|pro).*gemini",  # Google Gemini vision models
+    re.IGNORECASE,
+)
+
+# Canonical spellings that cover most calls, answered by a single hash lookup
+# before the regex (every entry must also match _VISION_MODEL_RE)
+_VISION_MODEL_NAMES = frozenset(
+    {
+        "gpt-4o",
+        "gpt-4o-mini",
+        "gpt-4-turbo",
+        "gpt-4-vision-preview",
+        "claude-3-opus",
+        "claude-3-sonnet",
+        "claude-3-haiku",
+        "claude-3-5-sonnet-latest",
+        "claude-3-5-haiku-latest",
+        "gemini-pro-vision",
+        "gemini-1.5-pro",
+    }
+)
+
+
+# Only a handful of distinct model names ever reach this, so memoize
+@functools.lru_cache(maxsize=256)
 def is_vision_model(model_name: str) -> bool:
     """
     Check if a model supports vision/image inputs.
@@ -110,23 +144,9 @@ def is_vision_model(model_name: str) -> bool:
     Returns:
         True if the model supports vision, False otherwise
     """
-    model_lower = model_name.lower()
-
-    # OpenAI vision models
-    if any(name in model_lower for name in ["gpt-4o", "gpt-4-turbo", "gpt-4-vision"]):
-        return True
-
-    # Anthropic Claude 3+ models (all support vision)
-    if any(
-        name in model_lower for name in ["claude-3", "claude-sonnet", "claude-opus", "claude-haiku"]
-    ):
-        return True
-
-    # Google Gemini vision models
-    if "gemini" in model_lower and ("vision" in model_lower or "pro" in model_lower):
+    if model_name in _VISION_MODEL_NAMES:
         return True
-
-    return False
+    return _VISION_MODEL_RE.search(model_name) is not None
 
 
 class ChatWebSocketHandler:
@@ -509,6 +529,20 @@ class ChatWebSocketHandler:
         )
         print(f"[SIMPLE RESPONSE] Initialized stream state for block {assistant_block.id}")
 
+        async def send_chunk(chunk_data: dict):
+            # Legacy buffer (for backward compatibility)
+            if session_id not in _chunk_buffers:
+                _chunk_buffers[session_id] = deque(maxlen=MAX_BUFFER_SIZE)
+            _chunk_buffers[session_id].append(chunk_data)
+
+            try:
+                await self.websocket.send_json(chunk_data)
+            except Exception:
+                print("[SIMPLE RESPONSE] WebSocket disconnected during chunk, continuing...")
+
+        # Coalesce token chunks into fewer WebSocket frames
+        chunk_batcher = ChunkBatcher(send_chunk)
+
         try:
             # Send assistant_text_start event
             await self.websocket.send_json(
@@ -527,6 +561,7 @@ class ChatWebSocketHandler:
                 if self.cancel_event.is_set():
                     print("[SIMPLE RESPONSE] Cancellation detected")
                     content_holder["cancelled"] = True
+                    await chunk_batcher.flush()
                     try:
                         await self.websocket.send_json(
                             {"type": "cancelled", "content": "Response cancelled by user"}
@@ -550,24 +585,8 @@ class ChatWebSocketHandler:
                     if session_id in _stream_states:
                         _stream_states[session_id].accumulated_content = content_holder["content"]
 
-                    # Create chunk event with block_id for proper tracking
-                    chunk_data = {
-                        "type": "chunk",
-                        "content": chunk,
-                        "block_id": assistant_block.id,  # Include block_id for frontend tracking
-                    }
-
-                    # Legacy buffer (for backward compatibility)
-                    if session_id not in _chunk_buffers:
-                        _chunk_buffers[session_id] = deque(maxlen=MAX_BUFFER_SIZE)
-                    _chunk_buffers[session_id].append(chunk_data)
-
-                    try:
-                        await self.websocket.send_json(chunk_data)
-                    except Exception:
-                        print(
-                            "[SIMPLE RESPONSE] WebSocket disconnected during chunk, continuing..."
-                        )
+                    # Queue chunk with block_id for proper frontend tracking
+                    await chunk_batcher.add(assistant_block.id, chunk)
 
                     # BATCHED INCREMENTAL SAVE: Update block content, commit periodically
                     assistant_block.content = {"text": content_holder["content"]}
@@ -581,6 +600,7 @@ class ChatWebSocketHandler:
         except asyncio.CancelledError:
             print("[SIMPLE RESPONSE] Task cancelled")
             content_holder["cancelled"] = True
+            await chunk_batcher.flush()
             try:
                 await self.websocket.send_json(
                     {"type": "cancelled", "content": "Response cancelled by user"}
@@ -588,6 +608,7 @@ class ChatWebSocketHandler:
             except Exception:
                 print("[SIMPLE RESPONSE] WebSocket disconnected, cannot send cancellation message")
         finally:
+            await chunk_batcher.flush()
             self.cancel_event = None
 
         # Update the content block with final content
@@ -749,6 +770,7 @@ class ChatWebSocketHandler:
             llm_provider=llm_provider,
             tool_registry=tool_registry,
             system_instructions=agent_config.system_instructions,
+            batch_action_streaming=settings.agent_batch_action_streaming,
         )
 
         # Create ASSISTANT_TEXT content block for final text response
@@ -843,12 +865,31 @@ class ChatWebSocketHandler:
         )
         print("[AGENT] Starting agent execution loop...")
 
+        async def send_chunk(chunk_data: dict):
+            # Legacy buffer (for backward compatibility)
+            if session_id not in _chunk_buffers:
+                _chunk_buffers[session_id] = deque(maxlen=MAX_BUFFER_SIZE)
+            _chunk_buffers[session_id].append(chunk_data)
+
+            # Forward chunk to frontend if WebSocket connected
+            try:
+                await self.websocket.send_json(chunk_data)
+            except Exception:
+                print("[AGENT] WebSocket disconnected during chunk, continuing...")
+
+        # Coalesce token chunks into fewer WebSocket frames
+        chunk_batcher = ChunkBatcher(send_chunk)
+
         event_count = 0
         try:
             async for event in agent.run(user_message, history, cancel_event=self.cancel_event):
                 event_count += 1
                 event_type = event.get("type")
 
+                # Buffered text must reach the client before any other event
+                if event_type != "chunk":
+                    await chunk_batcher.flush()
+
                 if event_type == "cancelled":
                     # Agent was cancelled
                     cancelled = True
@@ -869,21 +910,26 @@ class ChatWebSocketHandler:
                     step = event.get("step", 0)
                     print(f"[AGENT] Action Streaming: {tool_name} ({status})")
 
-                    # Track active tool call state for reconnection
+                    # Track active tool call state for reconnection. A batched event
+                    # announces several tools; like separate events, the last one
+                    # announced becomes the active call.
                     if session_id in _stream_states:
+                        announced = event["tools"][-1]["tool"] if "tools" in event else tool_name
                         _stream_states[session_id].active_tool_call = ToolCallState(
-                            tool_name=tool_name, partial_args="", step=step, status="streaming"
+                            tool_name=announced, partial_args="", step=step, status="streaming"
                         )
 
+                    message = {
+                        "type": "action_streaming",
+                        "tool": tool_name,
+                        "status": status,
+                        "step": step,
+                    }
+                    if "tools" in event:
+                        message["tools"] = event["tools"]
+
                     try:
-                        await self.websocket.send_json(
-                            {
-                                "type": "action_streaming",
-                                "tool": tool_name,
-                                "status": status,
-                                "step": step,
-                            }
-                        )
+                        await self.websocket.send_json(message)
                     except Exception:
                         print(
                             "[AGENT] WebSocket disconnected during action_streaming, continuing..."
@@ -1163,23 +1209,8 @@ class ChatWebSocketHandler:
                     if session_id in _stream_states:
                         _stream_states[session_id].accumulated_content = assistant_content
 
-                    # Create chunk event with block_id for proper tracking
-                    chunk_data = {
-                        "type": "chunk",
-                        "content": chunk,
-                        "block_id": current_text_block.id,  # Use current text block ID
-                    }
-
-                    # Legacy buffer (for backward compatibility)
-                    if session_id not in _chunk_buffers:
-                        _chunk_buffers[session_id] = deque(maxlen=MAX_BUFFER_SIZE)
-                    _chunk_buffers[session_id].append(chunk_data)
-
-                    # Forward chunk to frontend if WebSocket connected
-                    try:
-                        await self.websocket.send_json(chunk_data)
-                    except Exception:
-                        print("[AGENT] WebSocket disconnected during chunk, continuing...")
+                    # Queue chunk with the current text block ID for proper tracking
+                    await chunk_batcher.add(current_text_block.id, chunk)
 
                     # Batched commit: only commit periodically
                     if current_text_block:
@@ -1266,6 +1297,7 @@ class ChatWebSocketHandler:
             # Task was cancelled
             cancelled = True
             print("[AGENT] Task cancelled via CancelledError")
+            await chunk_batcher.flush()
             try:
                 await self.websocket.send_json(
                     {"type": "cancelled", "content": "Response cancelled by user"}
@@ -1273,6 +1305,7 @@ class ChatWebSocketHandler:
             except Exception:
                 print("[AGENT] WebSocket disconnected, cannot send cancellation message")
         finally:
+            await chunk_batcher.flush()
             self.cancel_event = None
 
         print(f"[AGENT] Agent execution completed. Total events: {event_count}")
@@ -1362,14 +1395,16 @@ class ChatWebSocketHandler:
         Returns:
             List of message dicts formatted for the LLM API
         """
-        # Query content blocks ordered by sequence number
+        # Query content blocks ordered by sequence number. Only the columns the
+        # history needs are selected: one round trip, no relationship loads, and
+        # no ORM objects piling up in the handler's long-lived identity map
         query = (
-            select(ContentBlock)
+            select(ContentBlock.block_type, ContentBlock.content, ContentBlock.block_metadata)
             .where(ContentBlock.chat_session_id == session_id)
             .order_by(ContentBlock.sequence_number.asc())
         )
         result = await self.db.execute(query)
-        blocks = result.scalars().all()
+        blocks = result.all()
 
         is_vlm = is_vision_model(model_name)
         history = []
@@ -1412,14 +1447,17 @@ class ChatWebSocketHandler:
                 tool_name = block.content.get("tool_name", "unknown")
                 result_text = block.content.get("result", "")
                 success = block.content.get("success", True)
-                metadata = block.block_metadata or {}
 
-                # Check if this is an image result for a VLM
-                has_image = metadata.get("type") == "image" and metadata.get("image_data")
+                # Check if this is an image result for a VLM; text-only models
+                # never use the image, so skip the metadata lookups for them
+                image_data = None
+                if is_vlm:
+                    metadata = block.block_metadata
+                    if metadata and metadata.get("type") == "image":
+                        image_data = metadata.get("image_data")
 
-                if has_image and is_vlm:
+                if image_data:
                     # Vision model: Use multi-content format with image
-                    image_data = metadata["image_data"]
                     text_content = f"Tool result ({tool_name}): {result_text}"
 
                     history.append(
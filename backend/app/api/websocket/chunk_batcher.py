@@ -0,0 +1,80 @@
+"""
+Chunk batching for WebSocket streaming.
+Coalesces token-level LLM chunks into fewer WebSocket frames without adding noticeable latency.
+"""
+
+import asyncio
+from typing import Awaitable, Callable, List, Optional
+
+
+class ChunkBatcher:
+    """
+    Coalesces text chunks into batched ``chunk`` frames.
+
+    A batch is sent when it reaches ``max_bytes``, when ``max_delay`` seconds have
+    passed since its first chunk, or when ``flush()`` is called. Callers must flush
+    before sending any other event so frame ordering is preserved.
+
+    Sends are serialized: a new batch is not sent until the previous send has
+    completed, so a slow client applies back-pressure instead of growing a queue
+    of pending frames.
+    """
+
+    def __init__(
+        self,
+        send: Callable[[dict], Awaitable[None]],
+        max_bytes: int = 512,
+        max_delay: float = 0.015,
+    ):
+        """
+        Initialize the batcher.
+
+        Args:
+            send: Coroutine that delivers one chunk event (must not raise)
+            max_bytes: Batch size that triggers an immediate send
+            max_delay: Maximum time in seconds a chunk waits in the batch
+        """
+        self._send = send
+        self.max_bytes = max_bytes
+        self.max_delay = max_delay
+        self._parts: List[str] = []
+        self._size = 0
+        self._block_id: Optional[str] = None
+        self._timer: Optional[asyncio.Task] = None
+        self._lock = asyncio.Lock()
+
+    async def add(self, block_id: str, content: str) -> None:
+        """Add a chunk for a block, sending the batch if it is full."""
+        if self._parts and block_id != self._block_id:
+            await self.flush()
+
+        self._block_id = block_id
+        self._parts.append(content)
+        self._size += len(content)
+
+        if self._size >= self.max_bytes:
+            await self.flush()
+        elif self._timer is None:
+            self._timer = asyncio.create_task(self._flush_later())
+
+    async def flush(self) -> None:
+        """Send any buffered content now."""
+        if self._timer is not None:
+            # The timer clears itself before sending, so it is still sleeping here
+            self._timer.cancel()
+            self._timer = None
+        await self._send_batch()
+
+    async def _flush_later(self) -> None:
+        await asyncio.sleep(self.max_delay)
+        self._timer = None
+        await self._send_batch()
+
+    async def _send_batch(self) -> None:
+        async with self._lock:
+            if not self._parts:
+                return
+            content = "".join(self._parts)
+            self._parts.clear()
+            self._size = 0
+            await self._send({"type": "chunk", "content": content, "block_id": self._block_id})
@@ -45,6 +45,7 @@ class ReActAgent:
         system_instructions: str | None = None,
         max_validation_retries: int = 3,
         max_same_tool_retries: int = 5,
+        batch_action_streaming: bool = False,
     ):
         """Initialize the ReAct agent.
 
@@ -55,6 +56,8 @@ class ReActAgent:
             system_instructions: Custom system instructions for the agent
             max_validation_retries: Maximum validation retry attempts before giving up
             max_same_tool_retries: Maximum retries for same tool to prevent loops
+            batch_action_streaming: Announce tool calls that arrive back-to-back
+                in one action_streaming event instead of one event per tool
         """
         self.llm = llm_provider
         self.tools = tool_registry
@@ -62,6 +65,7 @@ class ReActAgent:
         self.system_instructions = system_instructions or self._default_system_instructions()
         self.max_validation_retries = max_validation_retries
         self.max_same_tool_retries = max_same_tool_retries
+        self.batch_action_streaming = batch_action_streaming
 
         # Track retries per iteration (reset each iteration)
         self.validation_retry_count = 0
@@ -199,6 +203,24 @@ Use file_read('{file_path}') FIRST to see the exact content, then try your edit.
 
         return (True, "")
 
+    @staticmethod
+    def _action_streaming_event(tool_names: List[str], step: int) -> Dict[str, Any]:
+        """Build an action_streaming event announcing one or more tool calls.
+
+        A single tool keeps the original event shape. Several tools are listed
+        under ``tools``, with ``tool`` still naming the first one.
+        """
+        event = {
+            "type": "action_streaming",
+            "tool": tool_names[0],
+            "status": "streaming",
+            "step": step,
+        }
+        if len(tool_names) > 1:
+            print(f"[REACT AGENT] Emitting batched action_streaming event for {tool_names}")
+            event["tools"] = [{"tool": name} for name in tool_names]
+        return event
+
     async def run(
         self,
         user_message: str,
@@ -257,6 +279,8 @@ Use file_read('{file_path}') FIRST to see the exact content, then try your edit.
                 tool_calls = {}  # {index: {"name": str, "arguments": str}}
                 # Track which tool calls we've announced to avoid duplicate streaming events
                 announced_tool_calls = set()
+                # Tool names waiting to be announced together (batch_action_streaming only)
+                pending_announcements = []
 
                 print("[REACT AGENT] Calling LLM generate_stream...")
                 chunk_count = 0
@@ -278,6 +302,11 @@ Use file_read('{file_path}') FIRST to see the exact content, then try your edit.
                     chunk_count += 1
                     # Handle regular content
                     if isinstance(chunk, str):
+                        if pending_announcements:
+                            yield self._action_streaming_event(
+                                pending_announcements, iteration + 1
+                            )
+                            pending_announcements = []
                         full_response += chunk
                         if chunk_count <= 3:  # Only print first few chunks
                             print(f"[REACT AGENT] Text chunk #{chunk_count}: {chunk[:50]}...")
@@ -295,41 +324,50 @@ Use file_read('{file_path}') FIRST to see the exact content, then try your edit.
                         index = chunk.get("index", 0)
 
                         # Initialize tool call entry if needed
-                        if index not in tool_calls:
-                            tool_calls[index] = {"name": None, "arguments": ""}
+                        tool_call = tool_calls.get(index)
+                        if tool_call is None:
+                            tool_call = tool_calls[index] = {"name": None, "arguments": ""}
 
                         # IMPORTANT: Only set function_name if it's not None (preserve from first chunk)
-                        if function_call.get("name") is not None:
-                            tool_calls[index]["name"] = function_call.get("name")
+                        name = function_call.get("name")
+                        if name is not None:
+                            tool_call["name"] = name
 
                             # Emit real-time streaming event when we first see the tool name
                             # This gives immediate feedback to the user that an action is being prepared
                             if index not in announced_tool_calls:
                                 announced_tool_calls.add(index)
-                                print(
-                                    f"[REACT AGENT] Emitting action_streaming event for {function_call.get('name')}"
-                                )
-                                yield {
-                                    "type": "action_streaming",
-                                    "tool": function_call.get("name"),
-                                    "status": "streaming",
-                                    "step": iteration + 1,
-                                }
+                                if self.batch_action_streaming:
+                                    pending_announcements.append(name)
+                                else:
+                                    print(
+                                        f"[REACT AGENT] Emitting action_streaming event for {name}"
+                                    )
+                                    yield self._action_streaming_event([name], iteration + 1)
 
                         # Accumulate arguments from all chunks for this specific tool call index
-                        if function_call.get("arguments"):
-                            tool_calls[index]["arguments"] += function_call.get("arguments", "")
+                        arguments = function_call.get("arguments")
+                        if arguments:
+                            tool_call["arguments"] += arguments
 
                             # Emit real-time argument chunk event to show progressive build-up
                             # Only emit if we've already announced this tool (has a name)
-                            if tool_calls[index]["name"]:
+                            if tool_call["name"]:
+                                if pending_announcements:
+                                    yield self._action_streaming_event(
+                                        pending_announcements, iteration + 1
+                                    )
+                                    pending_announcements = []
                                 yield {
                                     "type": "action_args_chunk",
-                                    "tool": tool_calls[index]["name"],
-                                    "partial_args": tool_calls[index]["arguments"],
+                                    "tool": tool_call["name"],
+                                    "partial_args": tool_call["arguments"],
                                     "step": iteration + 1,
                                 }
 
+                if pending_announcements:
+                    yield self._action_streaming_event(pending_announcements, iteration + 1)
+
                 print(f"[REACT AGENT] Stream complete. Total chunks: {chunk_count}")
                 print(f"[REACT AGENT] Full response length: {len(full_response)}")
                 print(f"[REACT AGENT] Tool calls: {list(tool_calls.keys())}")
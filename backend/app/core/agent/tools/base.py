@@ -194,15 +194,20 @@ class ToolRegistry:
 
     def __init__(self):
         self._tools: Dict[str, Tool] = {}
+        # Tool definitions are static, so the LLM schemas are built once per
+        # registry change instead of on every agent iteration
+        self._llm_tools: List[Dict[str, Any]] | None = None
 
     def register(self, tool: Tool) -> None:
         """Register a tool."""
         self._tools[tool.name] = tool
+        self._llm_tools = None
 
     def unregister(self, tool_name: str) -> None:
         """Unregister a tool."""
         if tool_name in self._tools:
             del self._tools[tool_name]
+            self._llm_tools = None
 
     def get(self, tool_name: str) -> Tool | None:
         """Get a tool by name."""
@@ -213,8 +218,10 @@ class ToolRegistry:
         return list(self._tools.values())
 
     def get_tools_for_llm(self) -> List[Dict[str, Any]]:
-        """Get all tools formatted for LLM function calling."""
-        return [tool.format_for_llm() for tool in self._tools.values()]
+        """Get all tools formatted for LLM function calling (schemas are shared, don't mutate)."""
+        if self._llm_tools is None:
+            self._llm_tools = [tool.format_for_llm() for tool in self._tools.values()]
+        return list(self._llm_tools)
 
     def has_tool(self, tool_name: str) -> bool:
         """Check if a tool is registered."""
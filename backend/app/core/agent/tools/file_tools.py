@@ -7,6 +7,20 @@ from app.core.sandbox.container import SandboxContainer
 from app.core.sandbox.security import validate_file_path
 
 
+def _data_uri_mime_type(content: str) -> str:
+    """Return the MIME type of a data URI without copying its (possibly large) payload.
+
+    Only the header before the first comma is searched; a URI without a type
+    (or without a header at all) is reported as application/octet-stream.
+    """
+    header_end = content.find(",")
+    if header_end == -1:
+        return "application/octet-stream"
+    type_end = content.find(";", 0, header_end)
+    mime_type = content[len("data:") : header_end if type_end == -1 else type_end]
+    return mime_type or "application/octet-stream"
+
+
 # Pydantic schemas for parameter validation
 
 
@@ -152,9 +166,9 @@ class FileReadTool(Tool):
 
             # Add helpful message for images
             if is_binary and "image/" in content[:50]:
-                filename = path.split("/")[-1]
+                filename = path.rpartition("/")[2]
                 # Extract MIME type and calculate size
-                mime_type = content.split(";")[0].replace("data:", "")
+                mime_type = _data_uri_mime_type(content)
                 data_size_kb = len(content) // 1024
 
                 # ALWAYS use short message for LLM to save tokens
@@ -172,8 +186,8 @@ class FileReadTool(Tool):
                 metadata["filename"] = filename
                 metadata["mime_type"] = mime_type
             elif is_binary:
-                filename = path.split("/")[-1]
-                mime_type = content.split(";")[0].replace("data:", "")
+                filename = path.rpartition("/")[2]
+                mime_type = _data_uri_mime_type(content)
                 data_size_kb = len(content) // 1024
                 output_msg = (
                     f"Successfully read file: {path} ({data_size_kb}KB, {mime_type})\n"
@@ -15,11 +15,14 @@ class Settings(BaseSettings):
 
     # Database
     database_url: str = "sqlite+aiosqlite:///./data/open-claude-pilot.db"
+    database_pool_size: int = 20
+    database_max_overflow: int = 0
 
     # Server
     host: str = "127.0.0.1"
     port: int = 8000
     cors_origins: str = "http://localhost:3000,http://localhost:5173,http://localhost:5174"
+    log_level: str = "INFO"
 
     # Docker
     docker_container_pool_size: int = 5
@@ -35,6 +38,9 @@ class Settings(BaseSettings):
     s3_endpoint_url: str | None = None  # For MinIO or custom S3-compatible service
     s3_region: str = "us-east-1"
 
+    # Agent
+    agent_batch_action_streaming: bool = False
+
     # LLM Defaults
     default_llm_provider: str = "openai"
     default_llm_model: str = "gpt-5-mini"  # Use API-native model names (gpt-5, gpt-5-mini, etc.)
@@ -0,0 +1,66 @@
+"""Application logging setup.
+
+Log records are handed to a background thread through a queue, so handler
+I/O (stderr or a container log pipe) never blocks the event loop.
+"""
+
+import logging
+import logging.handlers
+import queue
+from typing import Optional, Tuple
+
+_listener: Optional[logging.handlers.QueueListener] = None
+_queue_handler: Optional[logging.handlers.QueueHandler] = None
+# (level, propagate) of the app logger before start_logging changed them
+_saved_state: Optional[Tuple[int, bool]] = None
+
+
+def start_logging(level: str = "INFO") -> None:
+    """
+    Route application log records through a queue to a background writer.
+
+    Args:
+        level: Log level for the ``app`` logger hierarchy
+    """
+    global _listener, _queue_handler, _saved_state
+
+    if _listener is not None:
+        return
+
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(
+        logging.Formatter("%(asctime)s %(levelname)s [%(name)s] %(message)s")
+    )
+
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    _queue_handler = logging.handlers.QueueHandler(log_queue)
+    _listener = logging.handlers.QueueListener(
+        log_queue, stream_handler, respect_handler_level=True
+    )
+
+    app_logger = logging.getLogger("app")
+    _saved_state = (app_logger.level, app_logger.propagate)
+    app_logger.setLevel(level.upper())
+    app_logger.addHandler(_queue_handler)
+    # Uvicorn configures the root logger; don't emit every record twice
+    app_logger.propagate = False
+
+    _listener.start()
+
+
+def stop_logging() -> None:
+    """Flush queued records, stop the background writer and undo start_logging."""
+    global _listener, _queue_handler, _saved_state
+
+    if _listener is None:
+        return
+
+    app_logger = logging.getLogger("app")
+    app_logger.removeHandler(_queue_handler)
+    app_logger.setLevel(_saved_state[0])
+    app_logger.propagate = _saved_state[1]
+
+    _listener.stop()
+    _listener = None
+    _queue_handler = None
+    _saved_state = None
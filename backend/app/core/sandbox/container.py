@@ -1,10 +1,14 @@
 """Docker container wrapper for sandbox execution."""
 
+import io
 import os
 import asyncio
-from typing import Tuple
+import tarfile
+from typing import Iterator, Tuple
 from docker.models.containers import Container as DockerContainer
 
+from app.core.storage.workspace_storage import ChunkReader
+
 
 class SandboxContainer:
     """Wrapper for a Docker container used as a sandbox."""
@@ -141,13 +145,37 @@ class SandboxContainer:
             File content or None if error
             For binary files (images, etc), returns base64-encoded string with prefix "data:image/..."
         """
+        import base64
+        import mimetypes
+
+        raw_bytes = await self.read_file_bytes(container_path)
+        if raw_bytes is None:
+            return None
+
+        # Try to decode as UTF-8 text
         try:
-            import tarfile
-            import io
-            import asyncio
-            import base64
-            import mimetypes
+            return raw_bytes.decode("utf-8")
+        except UnicodeDecodeError:
+            # Binary file - encode as base64 with data URI
+            # Guess MIME type from file extension
+            mime_type, _ = mimetypes.guess_type(container_path)
+            if mime_type is None:
+                mime_type = "application/octet-stream"
+
+            b64_data = base64.b64encode(raw_bytes).decode("ascii")
+            return f"data:{mime_type};base64,{b64_data}"
+
+    async def read_file_bytes(self, container_path: str) -> bytes | None:
+        """
+        Read the raw bytes of a file from the container.
 
+        Args:
+            container_path: Path inside container
+
+        Returns:
+            File bytes or None if the archive held no file
+        """
+        try:
             # Run blocking I/O in thread pool
             def _read():
                 # Get file as tar archive
@@ -164,21 +192,7 @@ class SandboxContainer:
                 if member:
                     f = tar.extractfile(member)
                     if f:
-                        raw_bytes = f.read()
-
-                        # Try to decode as UTF-8 text
-                        try:
-                            content = raw_bytes.decode("utf-8")
-                            return content
-                        except UnicodeDecodeError:
-                            # Binary file - encode as base64 with data URI
-                            # Guess MIME type from file extension
-                            mime_type, _ = mimetypes.guess_type(container_path)
-                            if mime_type is None:
-                                mime_type = "application/octet-stream"
-
-                            b64_data = base64.b64encode(raw_bytes).decode("ascii")
-                            return f"data:{mime_type};base64,{b64_data}"
+                        return f.read()
 
                 return None
 
@@ -193,6 +207,28 @@ class SandboxContainer:
             # Return error as string so FileReadTool can display it
             raise Exception(f"Failed to read file: {str(e)}")
 
+    def iter_directory_files(self, container_path: str) -> Iterator[Tuple[str, bytes]]:
+        """
+        Yield the name and bytes of each regular file directly inside a directory.
+
+        The directory is fetched as one tar archive and read as a stream, so any
+        number of files costs a single Docker API call and only one file is held
+        in memory at a time. This is blocking; advance it from a worker thread.
+
+        Args:
+            container_path: Directory path in container
+
+        Yields:
+            Tuples of (file name, file bytes)
+        """
+        bits, _ = self.container.get_archive(container_path)
+        with tarfile.open(fileobj=ChunkReader(bits), mode="r|") as tar:
+            for member in tar:
+                # Members are named relative to the directory's parent, e.g. "out/a.txt"
+                parts = member.name.split("/")
+                if member.isfile() and len(parts) == 2:
+                    yield parts[1], tar.extractfile(member).read()
+
     def list_files(self, container_path: str = "/workspace") -> list[str]:
         """
         List files in a directory.
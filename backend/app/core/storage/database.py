@@ -2,6 +2,7 @@
 
 import os
 from typing import AsyncGenerator
+from sqlalchemy.engine import make_url
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 from sqlalchemy.orm import declarative_base
 
@@ -10,11 +11,25 @@ from app.core.config import settings
 # Create data directory if it doesn't exist
 os.makedirs("./data", exist_ok=True)
 
+
+def _pool_options(database_url: str) -> dict:
+    """Connection pool sizing for the engine (in-memory SQLite uses a static pool)."""
+    url = make_url(database_url)
+    if url.get_backend_name() == "sqlite" and url.database in (None, "", ":memory:"):
+        return {}
+    return {
+        "pool_size": settings.database_pool_size,
+        "max_overflow": settings.database_max_overflow,
+        "pool_pre_ping": False,
+    }
+
+
 # Create async engine
 engine = create_async_engine(
     settings.database_url,
     echo=False,
     future=True,
+    **_pool_options(settings.database_url),
 )
 
 # Create async session maker
@@ -43,10 +58,20 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
             await session.close()
 
 
+def _create_missing_indexes(connection) -> None:
+    """Create model indexes that are missing from already existing tables."""
+    # create_all skips existing tables, so indexes added to a model later
+    # would otherwise never reach databases created before them
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(connection, checkfirst=True)
+
+
 async def init_db():
     """Initialize database tables."""
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
+        await conn.run_sync(_create_missing_indexes)
 
 
 async def close_db():
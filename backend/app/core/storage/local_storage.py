@@ -1,11 +1,17 @@
 """Local filesystem storage backend using bind mounts."""
 
+import os
 import asyncio
 import shutil
 from pathlib import Path
 from typing import List
 
-from app.core.storage.workspace_storage import WorkspaceStorage, FileInfo
+from app.core.storage.workspace_storage import (
+    WorkspaceStorage,
+    FileInfo,
+    FileStream,
+    READ_CHUNK_SIZE,
+)
 
 
 class LocalStorage(WorkspaceStorage):
@@ -71,6 +77,27 @@ class LocalStorage(WorkspaceStorage):
 
         return await asyncio.to_thread(host_path.read_bytes)
 
+    async def open_file(
+        self, session_id: str, container_path: str, chunk_size: int = READ_CHUNK_SIZE
+    ) -> FileStream:
+        """Open a file for streaming in chunks."""
+        host_path = self._get_host_path(session_id, container_path)
+
+        try:
+            f = await asyncio.to_thread(host_path.open, "rb")
+        except (FileNotFoundError, IsADirectoryError):
+            raise FileNotFoundError(f"File not found: {container_path}")
+        size = os.fstat(f.fileno()).st_size
+
+        async def _chunks():
+            try:
+                while chunk := await asyncio.to_thread(f.read, chunk_size):
+                    yield chunk
+            finally:
+                f.close()
+
+        return FileStream(_chunks(), size)
+
     async def list_files(
         self, session_id: str, container_path: str = "/workspace"
     ) -> List[FileInfo]:
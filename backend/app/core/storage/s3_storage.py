@@ -12,7 +12,12 @@ try:
 except ImportError:
     BOTO3_AVAILABLE = False
 
-from app.core.storage.workspace_storage import WorkspaceStorage, FileInfo
+from app.core.storage.workspace_storage import (
+    WorkspaceStorage,
+    FileInfo,
+    FileStream,
+    READ_CHUNK_SIZE,
+)
 
 
 class S3Storage(WorkspaceStorage):
@@ -113,7 +118,7 @@ class S3Storage(WorkspaceStorage):
         def _download():
             try:
                 response = self.s3_client.get_object(Bucket=self.bucket_name, Key=s3_key)
-                return response["Body"].read()
+                return response["Body"], response.get("ContentLength").read()
             except ClientError as e:
                 if e.response["Error"]["Code"] == "NoSuchKey":
                     raise FileNotFoundError(f"File not found: {container_path}")
@@ -121,6 +126,32 @@ class S3Storage(WorkspaceStorage):
 
         return await asyncio.to_thread(_download)
 
+    async def open_file(
+        self, session_id: str, container_path: str, chunk_size: int = READ_CHUNK_SIZE
+    ) -> FileStream:
+        """Open an S3 object for streaming in chunks."""
+        s3_key = self._get_s3_key(session_id, container_path)
+
+        def _open():
+            try:
+                response = self.s3_client.get_object(Bucket=self.bucket_name, Key=s3_key)
+                return response["Body"], response.get("ContentLength")
+            except ClientError as e:
+                if e.response["Error"]["Code"] == "NoSuchKey":
+                    raise FileNotFoundError(f"File not found: {container_path}")
+                raise
+
+        body, size = await asyncio.to_thread(_open)
+
+        async def _chunks():
+            try:
+                while chunk := await asyncio.to_thread(body.read, chunk_size):
+                    yield chunk
+            finally:
+                body.close()
+
+        return FileStream(_chunks(), size)
+
     async def list_files(
         self, session_id: str, container_path: str = "/workspace"
     ) -> List[FileInfo]:
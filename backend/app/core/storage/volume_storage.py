@@ -7,7 +7,13 @@ from pathlib import Path
 from typing import List, Optional
 import docker
 
-from app.core.storage.workspace_storage import WorkspaceStorage, FileInfo
+from app.core.storage.workspace_storage import (
+    ChunkReader,
+    WorkspaceStorage,
+    FileInfo,
+    FileStream,
+    READ_CHUNK_SIZE,
+)
 
 
 class VolumeStorage(WorkspaceStorage):
@@ -130,6 +136,63 @@ class VolumeStorage(WorkspaceStorage):
                 raise FileNotFoundError(f"File not found: {container_path}")
             raise
 
+    async def open_file(
+        self, session_id: str, container_path: str, chunk_size: int = READ_CHUNK_SIZE
+    ) -> FileStream:
+        """
+        Open a file in the Docker volume for streaming in chunks.
+
+        The archive from get_archive is read as a stream rather than buffered,
+        so the helper container stays up until the returned stream is closed.
+        """
+        volume_name = self._get_volume_name(session_id)
+
+        def _open():
+            path = container_path.lstrip("/")
+
+            container = self.docker_client.containers.run(
+                "alpine:latest",
+                command="sh -c 'sleep 5'",
+                volumes={volume_name: {"bind": "/workspace", "mode": "ro"}},
+                detach=True,
+                remove=False,
+            )
+
+            try:
+                bits, stat = container.get_archive(f"/{path}")
+                tar = tarfile.open(fileobj=ChunkReader(bits), mode="r|")
+                member = tar.next()
+                file_content = tar.extractfile(member) if member is not None else None
+
+                if file_content is None:
+                    tar.close()
+                    raise FileNotFoundError(f"File not found: {container_path}")
+
+                return container, tar, file_content, member.size
+            except BaseException:
+                container.remove(force=True)
+                raise
+
+        try:
+            container, tar, file_content, size = await asyncio.to_thread(_open)
+        except Exception as e:
+            if "No such file" in str(e) or "404" in str(e):
+                raise FileNotFoundError(f"File not found: {container_path}")
+            raise
+
+        def _close():
+            tar.close()
+            container.remove(force=True)
+
+        async def _chunks():
+            try:
+                while chunk := await asyncio.to_thread(file_content.read, chunk_size):
+                    yield chunk
+            finally:
+                await asyncio.to_thread(_close)
+
+        return FileStream(_chunks(), size)
+
     async def list_files(
         self, session_id: str, container_path: str = "/workspace"
     ) -> List[FileInfo]:
@@ -1,9 +1,39 @@
 """Workspace storage abstraction for different storage backends."""
 
+import io
 from abc import ABC, abstractmethod
-from typing import List
+from typing import AsyncIterator, Iterable, List, Optional
 from pathlib import Path
 
+# Chunk size for streaming reads
+READ_CHUNK_SIZE = 64 * 1024
+
+
+class ChunkReader(io.RawIOBase):
+    """Readable stream over an iterable of byte chunks, such as a Docker archive response."""
+
+    def __init__(self, chunks: Iterable[bytes]):
+        self._chunks = iter(chunks)
+        self._buffer = memoryview(b"")
+        self._pos = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, b) -> int:
+        # Track a position into the current chunk rather than slicing off the
+        # consumed prefix, so each read copies only the bytes it returns
+        while self._pos >= len(self._buffer):
+            try:
+                self._buffer = memoryview(next(self._chunks))
+            except StopIteration:
+                return 0
+            self._pos = 0
+        n = min(len(b), len(self._buffer) - self._pos)
+        b[:n] = self._buffer[self._pos : self._pos + n]
+        self._pos += n
+        return n
+
 
 class FileInfo:
     """File metadata."""
@@ -14,6 +44,17 @@ class FileInfo:
         self.is_dir = is_dir
 
 
+class FileStream:
+    """An open file: async-iterate it for the content chunks."""
+
+    def __init__(self, chunks: AsyncIterator[bytes], size: Optional[int] = None):
+        self.size = size  # Total size in bytes, if the backend knows it up front
+        self._chunks = chunks
+
+    def __aiter__(self) -> AsyncIterator[bytes]:
+        return self._chunks
+
+
 class WorkspaceStorage(ABC):
     """Abstract interface for workspace storage backends."""
 
@@ -49,6 +90,34 @@ class WorkspaceStorage(ABC):
         """
         pass
 
+    async def open_file(
+        self, session_id: str, container_path: str, chunk_size: int = READ_CHUNK_SIZE
+    ) -> FileStream:
+        """
+        Open a file in the workspace for streaming.
+
+        The default implementation reads the whole file; backends that can
+        read incrementally override this so large files are never fully
+        buffered.
+
+        Args:
+            session_id: Chat session ID
+            container_path: Path inside container (e.g., '/workspace/out/file.py')
+            chunk_size: Maximum size of each yielded chunk
+
+        Returns:
+            Stream over the file content, with its size when known
+
+        Raises:
+            FileNotFoundError: If file doesn't exist (raised here, not on iteration)
+        """
+        content = await self.read_file(session_id, container_path)
+
+        async def _chunks():
+            yield content
+
+        return FileStream(_chunks(), len(content))
+
     @abstractmethod
     async def list_files(
         self, session_id: str, container_path: str = "/workspace"
@@ -5,6 +5,7 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.core.config import settings
+from app.core.logging_config import start_logging, stop_logging
 from app.core.storage.database import init_db, close_db
 from app.api.routes import projects, chat, sandbox, files, settings as settings_routes
 from app.api.websocket.streaming_manager import streaming_manager
@@ -17,6 +18,8 @@ import app.models.database  # noqa: F401
 async def lifespan(app: FastAPI):
     """Application lifespan handler."""
     # Startup
+    start_logging(settings.log_level)
+
     print("Initializing database...")
     await init_db()
     print("Database initialized successfully")
@@ -36,6 +39,7 @@ async def lifespan(app: FastAPI):
     print("Closing database connections...")
     await close_db()
     print("Application shutdown complete")
+    stop_logging()
 
 
 # Create FastAPI app
@@ -2,7 +2,7 @@
 
 import uuid
 from datetime import datetime
-from sqlalchemy import Column, String, DateTime, ForeignKey, Enum, JSON
+from sqlalchemy import Column, String, DateTime, ForeignKey, Enum, JSON, Index
 from sqlalchemy.orm import relationship
 import enum
 
@@ -42,3 +42,8 @@ class ChatSession(Base):
     content_blocks = relationship(
         "ContentBlock", back_populates="chat_session", cascade="all, delete-orphan"
     )
+
+    __table_args__ = (
+        # Per-project session listing, newest first
+        Index("ix_chat_sessions_project_created", project_id, created_at.desc()),
+    )
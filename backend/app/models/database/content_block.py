@@ -2,7 +2,7 @@
 
 import uuid
 from datetime import datetime
-from sqlalchemy import Column, String, DateTime, ForeignKey, Enum, JSON, Integer
+from sqlalchemy import Column, String, DateTime, ForeignKey, Enum, JSON, Integer, Index
 from sqlalchemy.orm import relationship
 import enum
 
@@ -48,7 +48,7 @@ class ContentBlock(Base):
 
     id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
     chat_session_id = Column(
-        String(36), ForeignKey("chat_sessions.id", ondelete="CASCADE"), nullable=False, index=True
+        String(36), ForeignKey("chat_sessions.id", ondelete="CASCADE"), nullable=False
     )
 
     # Ordering - guarantees consistent display order
@@ -79,8 +79,18 @@ class ContentBlock(Base):
 
     # Relationships
     chat_session = relationship("ChatSession", back_populates="content_blocks")
-    children = relationship(
-        "ContentBlock", backref="parent", remote_side=[id], foreign_keys=[parent_block_id]
+    parent = relationship(
+        "ContentBlock",
+        back_populates="children",
+        remote_side=[id],
+        foreign_keys=[parent_block_id],
+    )
+    children = relationship("ContentBlock", back_populates="parent", foreign_keys=[parent_block_id])
+
+    __table_args__ = (
+        # Serves the per-session listing (filter + ORDER BY sequence_number) as a
+        # range scan; also covers lookups by chat_session_id alone
+        Index("ix_content_blocks_session_seq", "chat_session_id", "sequence_number"),
     )
 
     def __repr__(self):
@@ -0,0 +1,18 @@
+"""Shared helpers for API schemas."""
+
+from typing import Any
+
+
+class FromORMFastMixin:
+    """Adds ``from_orm_fast`` to response schemas listed straight from the DB."""
+
+    @classmethod
+    def from_orm_fast(cls, obj: Any):
+        """Build a response from a trusted ORM row without running validation.
+
+        Rows loaded from our own database are already type-coerced by
+        SQLAlchemy, so validation is deliberately bypassed on listing paths.
+        Each field is read from the ORM attribute of the same name. Use
+        ``model_validate`` for anything that did not come from the DB.
+        """
+        return cls.model_construct(**{name: getattr(obj, name) for name in cls.model_fields})
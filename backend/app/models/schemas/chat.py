@@ -4,6 +4,7 @@ from datetime import datetime
 from pydantic import BaseModel, Field
 
 from app.models.database.chat_session import ChatSessionStatus
+from app.models.schemas.base import FromORMFastMixin
 
 
 class ChatSessionBase(BaseModel):
@@ -25,7 +26,7 @@ class ChatSessionUpdate(BaseModel):
     status: ChatSessionStatus | None = None
 
 
-class ChatSessionResponse(ChatSessionBase):
+class ChatSessionResponse(FromORMFastMixin, ChatSessionBase):
     """Schema for chat session response."""
 
     id: str
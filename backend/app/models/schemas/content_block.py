@@ -5,6 +5,7 @@ from typing import Dict, Any, Optional, List
 from pydantic import BaseModel, Field
 
 from app.models.database.content_block import ContentBlockType, ContentBlockAuthor
+from app.models.schemas.base import FromORMFastMixin
 
 
 class ContentBlockBase(BaseModel):
@@ -29,7 +30,7 @@ class ContentBlockUpdate(BaseModel):
     block_metadata: Optional[Dict[str, Any]] = None
 
 
-class ContentBlockResponse(BaseModel):
+class ContentBlockResponse(FromORMFastMixin, BaseModel):
     """Schema for content block response."""
 
     id: str
@@ -52,6 +53,9 @@ class ContentBlockListResponse(BaseModel):
 
     blocks: List[ContentBlockResponse]
     total: int
+    next_after_seq: Optional[int] = Field(
+        None, description="Cursor for the next page (pass as after_seq), null on the last page"
+    )
 
 
 # Convenience schemas for specific block types
@@ -1,10 +1,15 @@
 """Tests for Chat API routes."""
 
+import io
+import tarfile
+import zipfile
+from datetime import datetime
+
 import pytest
 from unittest.mock import AsyncMock, patch, MagicMock
 from fastapi import FastAPI
 from httpx import AsyncClient, ASGITransport
-from sqlalchemy import select
+from sqlalchemy import event, select
 
 from app.api.routes.chat import router, WorkspaceFile, WorkspaceFilesResponse
 from app.models.database import ChatSession, Project, ContentBlock
@@ -69,6 +74,40 @@ class TestChatSessionAPI:
         assert data["total"] >= 1
         assert all(s["project_id"] == sample_project.id for s in data["chat_sessions"])
 
+    @pytest.mark.asyncio
+    async def test_list_chat_sessions_past_end_keeps_filtered_total(
+        self, app, db_session, sample_project, sample_chat_session
+    ):
+        """Test the total still honours the project filter when the page is empty."""
+        other_project = Project(name="Other Project")
+        db_session.add(other_project)
+        await db_session.flush()
+        db_session.add(ChatSession(project_id=other_project.id, name="Other Session"))
+        await db_session.commit()
+
+        transport = ASGITransport(app=app)
+        async with AsyncClient(transport=transport, base_url="http://test") as client:
+            response = await client.get(f"/api/v1/chats?project_id={sample_project.id}&skip=10")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["chat_sessions"] == []
+        assert data["total"] == 1
+
+    @pytest.mark.asyncio
+    async def test_list_chat_sessions_zero_limit_keeps_total(
+        self, app, db_session, sample_chat_session
+    ):
+        """Test an empty page requested with limit=0 still reports the real total."""
+        transport = ASGITransport(app=app)
+        async with AsyncClient(transport=transport, base_url="http://test") as client:
+            response = await client.get("/api/v1/chats?limit=0")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["chat_sessions"] == []
+        assert data["total"] == 1
+
     @pytest.mark.asyncio
     async def test_create_chat_session(self, app, db_session, sample_project):
         """Test creating a chat session."""
@@ -82,6 +121,9 @@ class TestChatSessionAPI:
         data = response.json()
         assert data["name"] == "New Chat Session"
         assert data["project_id"] == sample_project.id
+        assert data["status"] == "active"
+        assert data["created_at"] is not None
+        assert data["updated_at"] is not None
 
     @pytest.mark.asyncio
     async def test_create_chat_session_project_not_found(self, app, db_session):
@@ -118,6 +160,7 @@ class TestChatSessionAPI:
     @pytest.mark.asyncio
     async def test_update_chat_session(self, app, db_session, sample_chat_session):
         """Test updating a chat session."""
+        previous_updated_at = sample_chat_session.updated_at
         transport = ASGITransport(app=app)
         async with AsyncClient(transport=transport, base_url="http://test") as client:
             response = await client.put(
@@ -127,6 +170,7 @@ class TestChatSessionAPI:
         assert response.status_code == 200
         data = response.json()
         assert data["name"] == "Updated Name"
+        assert datetime.fromisoformat(data["updated_at"]) > previous_updated_at
 
     @pytest.mark.asyncio
     async def test_update_chat_session_not_found(self, app, db_session):
@@ -235,6 +279,126 @@ class TestContentBlocksAPI:
         assert data["total"] == 3
         assert len(data["blocks"]) == 3
 
+    @pytest.mark.asyncio
+    async def test_list_content_blocks_paginated_total(self, app, db_session, sample_chat_session):
+        """Test total reflects all blocks, including when paging past the end."""
+        for i in range(5):
+            db_session.add(
+                ContentBlock(
+                    chat_session_id=sample_chat_session.id,
+                    block_type=ContentBlockType.USER_TEXT,
+                    author=ContentBlockAuthor.USER,
+                    content={"text": f"Test content {i}"},
+                    sequence_number=i,
+                )
+            )
+        await db_session.commit()
+
+        transport = ASGITransport(app=app)
+        async with AsyncClient(transport=transport, base_url="http://test") as client:
+            page = await client.get(
+                f"/api/v1/chats/{sample_chat_session.id}/blocks?skip=1&limit=2"
+            )
+            past_end = await client.get(
+                f"/api/v1/chats/{sample_chat_session.id}/blocks?skip=10&limit=2"
+            )
+
+        data = page.json()
+        assert data["total"] == 5
+        assert [b["sequence_number"] for b in data["blocks"]] == [1, 2]
+
+        data = past_end.json()
+        assert data["total"] == 5
+        assert data["blocks"] == []
+
+    @pytest.mark.asyncio
+    async def test_list_content_blocks_zero_limit(self, app, db_session, sample_chat_session):
+        """Test limit=0 returns an empty page with the real total and no cursor."""
+        db_session.add(
+            ContentBlock(
+                chat_session_id=sample_chat_session.id,
+                block_type=ContentBlockType.USER_TEXT,
+                author=ContentBlockAuthor.USER,
+                content={"text": "Test content"},
+                sequence_number=0,
+            )
+        )
+        await db_session.commit()
+
+        transport = ASGITransport(app=app)
+        async with AsyncClient(transport=transport, base_url="http://test") as client:
+            response = await client.get(f"/api/v1/chats/{sample_chat_session.id}/blocks?limit=0")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["blocks"] == []
+        assert data["total"] == 1
+        assert data["next_after_seq"] is None
+
+    @pytest.mark.asyncio
+    async def test_list_content_blocks_single_query(self, app, db_session, sample_chat_session):
+        """Test a non-empty session is listed without a separate existence check."""
+        db_session.add(
+            ContentBlock(
+                chat_session_id=sample_chat_session.id,
+                block_type=ContentBlockType.USER_TEXT,
+                author=ContentBlockAuthor.USER,
+                content={"text": "hello"},
+                sequence_number=0,
+            )
+        )
+        await db_session.commit()
+
+        statements = []
+
+        def _record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        sync_engine = db_session.bind.sync_engine
+        event.listen(sync_engine, "before_cursor_execute", _record)
+        try:
+            transport = ASGITransport(app=app)
+            async with AsyncClient(transport=transport, base_url="http://test") as client:
+                response = await client.get(f"/api/v1/chats/{sample_chat_session.id}/blocks")
+        finally:
+            event.remove(sync_engine, "before_cursor_execute", _record)
+
+        assert response.status_code == 200
+        assert response.json()["total"] == 1
+        assert len([s for s in statements if s.lstrip().upper().startswith("SELECT")]) == 1
+
+    @pytest.mark.asyncio
+    async def test_list_content_blocks_keyset_pagination(
+        self, app, db_session, sample_chat_session
+    ):
+        """Test paging with after_seq follows next_after_seq to the last page."""
+        for i in range(1, 6):
+            db_session.add(
+                ContentBlock(
+                    chat_session_id=sample_chat_session.id,
+                    block_type=ContentBlockType.USER_TEXT,
+                    author=ContentBlockAuthor.USER,
+                    content={"text": f"Test content {i}"},
+                    sequence_number=i,
+                )
+            )
+        await db_session.commit()
+
+        pages = []
+        after_seq = 0
+        transport = ASGITransport(app=app)
+        async with AsyncClient(transport=transport, base_url="http://test") as client:
+            while after_seq is not None:
+                response = await client.get(
+                    f"/api/v1/chats/{sample_chat_session.id}/blocks?after_seq={after_seq}&limit=2"
+                )
+                data = response.json()
+                assert data["total"] == 5
+                pages.append([b["sequence_number"] for b in data["blocks"]])
+                after_seq = data["next_after_seq"]
+
+        assert pages == [[1, 2], [3, 4], [5]]
+
     @pytest.mark.asyncio
     async def test_list_content_blocks_session_not_found(self, app, db_session):
         """Test listing blocks for non-existent session."""
@@ -303,6 +467,30 @@ class TestWorkspaceFilesAPI:
             assert "uploaded" in data
             assert "output" in data
 
+    @pytest.mark.asyncio
+    async def test_list_workspace_files_parses_container_output(
+        self, app, db_session, sample_chat_session
+    ):
+        """Test output files are parsed from NUL-separated find records."""
+        find_output = "/workspace/out/report.json\x00128\x00/workspace/out/a\tb.png\x007\x00"
+        with patch("app.api.routes.chat.get_container_manager") as mock_manager:
+            mock_container = MagicMock()
+            mock_container.execute = AsyncMock(return_value=(0, find_output, ""))
+            mock_manager.return_value.get_container = AsyncMock(return_value=mock_container)
+
+            transport = ASGITransport(app=app)
+            async with AsyncClient(transport=transport, base_url="http://test") as client:
+                response = await client.get(
+                    f"/api/v1/chats/{sample_chat_session.id}/workspace/files"
+                )
+
+        assert response.status_code == 200
+        output = response.json()["output"]
+        assert [(f["name"], f["path"], f["size"], f["mime_type"]) for f in output] == [
+            ("report.json", "/workspace/out/report.json", 128, "application/json"),
+            ("a\tb.png", "/workspace/out/a\tb.png", 7, "image/png"),
+        ]
+
     @pytest.mark.asyncio
     async def test_list_workspace_files_session_not_found(self, app, db_session):
         """Test listing files for non-existent session."""
@@ -326,6 +514,45 @@ class TestWorkspaceFilesAPI:
         assert response.status_code == 400
         assert "workspace" in response.json()["detail"].lower()
 
+    @pytest.mark.asyncio
+    async def test_get_workspace_file_content_rejects_traversal(
+        self, app, db_session, sample_chat_session
+    ):
+        """Test paths escaping /workspace/ via .. are rejected before touching the container."""
+        with patch("app.api.routes.chat.get_container_manager") as mock_manager:
+            transport = ASGITransport(app=app)
+            async with AsyncClient(transport=transport, base_url="http://test") as client:
+                for path in ["/workspace/../etc/passwd", "/workspace/out/../../etc/passwd"]:
+                    response = await client.get(
+                        f"/api/v1/chats/{sample_chat_session.id}/workspace/files/content",
+                        params={"path": path},
+                    )
+                    assert response.status_code == 400
+
+            mock_manager.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_get_workspace_file_content_quotes_path(
+        self, app, db_session, sample_chat_session
+    ):
+        """Test the existence check quotes the path for the shell."""
+        with patch("app.api.routes.chat.get_container_manager") as mock_manager:
+            mock_container = MagicMock()
+            mock_container.execute = AsyncMock(return_value=(0, "", ""))
+            mock_container.read_file_bytes = AsyncMock(return_value=b"data")
+            mock_manager.return_value.get_container = AsyncMock(return_value=mock_container)
+
+            transport = ASGITransport(app=app)
+            async with AsyncClient(transport=transport, base_url="http://test") as client:
+                response = await client.get(
+                    f"/api/v1/chats/{sample_chat_session.id}/workspace/files/content",
+                    params={"path": "/workspace/out/it's here.txt"},
+                )
+
+            assert response.status_code == 200
+            command = mock_container.execute.call_args[0][0]
+            assert command == "test -f '/workspace/out/it'\"'\"'s here.txt'"
+
     @pytest.mark.asyncio
     async def test_get_workspace_file_content_file_not_found(
         self, app, db_session, sample_chat_session
@@ -350,7 +577,7 @@ class TestWorkspaceFilesAPI:
         with patch("app.api.routes.chat.get_container_manager") as mock_manager:
             mock_container = MagicMock()
             mock_container.execute = AsyncMock(return_value=(0, "", ""))  # File exists
-            mock_container.read_file = AsyncMock(return_value="file content here")
+            mock_container.read_file_bytes = AsyncMock(return_value=b"file content here")
             mock_manager.return_value.get_container = AsyncMock(return_value=mock_container)
 
             transport = ASGITransport(app=app)
@@ -371,7 +598,7 @@ class TestWorkspaceFilesAPI:
         with patch("app.api.routes.chat.get_container_manager") as mock_manager:
             mock_container = MagicMock()
             mock_container.execute = AsyncMock(return_value=(0, "", ""))
-            mock_container.read_file = AsyncMock(return_value="file content")
+            mock_container.read_file_bytes = AsyncMock(return_value=b"file content")
             mock_manager.return_value.get_container = AsyncMock(return_value=mock_container)
 
             transport = ASGITransport(app=app)
@@ -382,6 +609,61 @@ class TestWorkspaceFilesAPI:
 
             assert response.status_code == 200
             assert "attachment" in response.headers.get("content-disposition", "")
+            assert response.headers["content-length"] == str(len(b"file content"))
+            assert response.content == b"file content"
+
+    @pytest.mark.asyncio
+    async def test_download_workspace_file_binary(self, app, db_session, sample_chat_session):
+        """Test binary files are downloaded as raw bytes."""
+        png_bytes = b"\x89PNG\r\n\x1a\n\xff\xfe"
+        with patch("app.api.routes.chat.get_container_manager") as mock_manager:
+            mock_container = MagicMock()
+            mock_container.execute = AsyncMock(return_value=(0, "", ""))
+            mock_container.read_file_bytes = AsyncMock(return_value=png_bytes)
+            mock_manager.return_value.get_container = AsyncMock(return_value=mock_container)
+
+            transport = ASGITransport(app=app)
+            async with AsyncClient(transport=transport, base_url="http://test") as client:
+                response = await client.get(
+                    f"/api/v1/chats/{sample_chat_session.id}/workspace/files/download?path=/workspace/out/plot.png"
+                )
+
+            assert response.status_code == 200
+            assert response.headers["content-type"] == "image/png"
+            assert response.content == png_bytes
+
+    @pytest.mark.asyncio
+    async def test_download_workspace_file_streams_from_storage(
+        self, app, db_session, sample_chat_session, temp_workspace
+    ):
+        """Test files are streamed from storage in chunks when no container is running."""
+        from app.core.storage.local_storage import LocalStorage
+
+        storage = LocalStorage(workspace_base=str(temp_workspace))
+        content = b"x" * (200 * 1024)
+        await storage.write_file(sample_chat_session.id, "/workspace/out/big.bin", content)
+
+        with (
+            patch("app.api.routes.chat.get_container_manager") as mock_manager,
+            patch("app.api.routes.chat.get_storage", return_value=storage),
+        ):
+            mock_manager.return_value.get_container = AsyncMock(return_value=None)
+
+            transport = ASGITransport(app=app)
+            async with AsyncClient(transport=transport, base_url="http://test") as client:
+                response = await client.get(
+                    f"/api/v1/chats/{sample_chat_session.id}/workspace/files/download",
+                    params={"path": "/workspace/out/big.bin"},
+                )
+                missing = await client.get(
+                    f"/api/v1/chats/{sample_chat_session.id}/workspace/files/download",
+                    params={"path": "/workspace/out/missing.bin"},
+                )
+
+        assert response.status_code == 200
+        assert response.headers["content-length"] == str(len(content))
+        assert response.content == content
+        assert missing.status_code == 404
 
     @pytest.mark.asyncio
     async def test_download_all_workspace_files_no_files(
@@ -402,6 +684,109 @@ class TestWorkspaceFilesAPI:
             assert response.status_code == 404
             assert "No output files found" in response.json()["detail"]
 
+    @pytest.mark.asyncio
+    async def test_download_all_workspace_files_streams_zip(
+        self, app, db_session, sample_chat_session
+    ):
+        """Test downloading all output files returns a readable zip archive."""
+        contents = {
+            "/workspace/out/notes.txt": b"hello world",
+            "/workspace/out/plot.png": b"\x89PNG\r\n\x1a\n",
+        }
+        find_output = "".join(f"{path}\x001\x00" for path in contents)
+        with patch("app.api.routes.chat.get_container_manager") as mock_manager:
+            mock_container = MagicMock()
+            mock_container.execute = AsyncMock(return_value=(0, find_output, ""))
+            # Files in the archive but not in the listing are left out
+            mock_container.iter_directory_files = MagicMock(
+                side_effect=lambda directory: (
+                    (path.rpartition("/")[2], data)
+                    for path, data in [*contents.items(), ("/workspace/out/new.txt", b"late")]
+                )
+            )
+            mock_manager.return_value.get_container = AsyncMock(return_value=mock_container)
+
+            transport = ASGITransport(app=app)
+            async with AsyncClient(transport=transport, base_url="http://test") as client:
+                response = await client.get(
+                    f"/api/v1/chats/{sample_chat_session.id}/workspace/download-all?type=output"
+                )
+
+        mock_container.iter_directory_files.assert_called_once_with("/workspace/out")
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/zip"
+        with zipfile.ZipFile(io.BytesIO(response.content)) as archive:
+            assert archive.read("notes.txt") == b"hello world"
+            assert archive.read("plot.png") == b"\x89PNG\r\n\x1a\n"
+            assert archive.getinfo("notes.txt").compress_type == zipfile.ZIP_DEFLATED
+            assert archive.getinfo("plot.png").compress_type == zipfile.ZIP_STORED
+            assert "new.txt" not in archive.namelist()
+
+    @pytest.mark.asyncio
+    async def test_download_all_workspace_files_large_entry_uses_zip64(
+        self, app, db_session, sample_chat_session
+    ):
+        """Test an entry past the zip64 threshold still produces a complete archive."""
+        content = b"x" * 4096
+        find_output = "/workspace/out/big.bin\x001\x00"
+        with patch("app.api.routes.chat.get_container_manager") as mock_manager:
+            mock_container = MagicMock()
+            mock_container.execute = AsyncMock(return_value=(0, find_output, ""))
+            mock_container.iter_directory_files = MagicMock(
+                side_effect=lambda directory: (entry for entry in [("big.bin", content)])
+            )
+            mock_manager.return_value.get_container = AsyncMock(return_value=mock_container)
+
+            transport = ASGITransport(app=app)
+            with patch("zipfile.ZIP64_LIMIT", 1024):
+                async with AsyncClient(transport=transport, base_url="http://test") as client:
+                    response = await client.get(
+                        f"/api/v1/chats/{sample_chat_session.id}/workspace/download-all"
+                        "?type=output"
+                    )
+
+        assert response.status_code == 200
+        with zipfile.ZipFile(io.BytesIO(response.content)) as archive:
+            assert archive.read("big.bin") == content
+
+    @pytest.mark.asyncio
+    async def test_download_all_workspace_files_archive_failure_falls_back(
+        self, app, db_session, sample_chat_session
+    ):
+        """Test files the archive failed to deliver are read one by one, skipping failures."""
+        contents = {
+            "/workspace/out/notes.txt": b"hello world",
+            "/workspace/out/data.csv": b"a,b\n1,2\n",
+            "/workspace/out/broken.bin": None,
+        }
+        find_output = "".join(f"{path}\x001\x00" for path in contents)
+
+        def _archive(directory):
+            yield "notes.txt", contents["/workspace/out/notes.txt"]
+            raise tarfile.ReadError("unexpected end of data")
+
+        with patch("app.api.routes.chat.get_container_manager") as mock_manager:
+            mock_container = MagicMock()
+            mock_container.execute = AsyncMock(return_value=(0, find_output, ""))
+            mock_container.iter_directory_files = MagicMock(side_effect=_archive)
+            mock_container.read_file_bytes = AsyncMock(side_effect=lambda path: contents[path])
+            mock_manager.return_value.get_container = AsyncMock(return_value=mock_container)
+
+            transport = ASGITransport(app=app)
+            async with AsyncClient(transport=transport, base_url="http://test") as client:
+                response = await client.get(
+                    f"/api/v1/chats/{sample_chat_session.id}/workspace/download-all?type=output"
+                )
+
+        assert response.status_code == 200
+        with zipfile.ZipFile(io.BytesIO(response.content)) as archive:
+            assert sorted(archive.namelist()) == ["data.csv", "notes.txt"]
+            assert archive.read("notes.txt") == b"hello world"
+            assert archive.read("data.csv") == b"a,b\n1,2\n"
+        # notes.txt came from the archive, so only the remaining files are re-read
+        read_paths = [c.args[0] for c in mock_container.read_file_bytes.await_args_list]
+        assert read_paths == ["/workspace/out/data.csv", "/workspace/out/broken.bin"]
+
     @pytest.mark.asyncio
     async def test_download_all_invalid_type(self, app, db_session, sample_chat_session):
         """Test downloading with invalid type parameter."""
@@ -1,18 +1,29 @@
 """Tests for the ChatWebSocketHandler module."""
 
+import uuid
+
 import pytest
 import asyncio
 from datetime import datetime
 from unittest.mock import AsyncMock, MagicMock
+from sqlalchemy import event
 
 from app.api.websocket.chat_handler import (
     is_vision_model,
+    _VISION_MODEL_NAMES,
+    _VISION_MODEL_RE,
     ToolCallState,
     StreamState,
     ChatWebSocketHandler,
     create_orchestrator,
 )
-from app.models.database import ContentBlock, ContentBlockType, ContentBlockAuthor
+from app.models.database import (
+    ChatSession,
+    ContentBlock,
+    ContentBlockAuthor,
+    ContentBlockType,
+    Project,
+)
 
 
 @pytest.mark.websocket
@@ -72,6 +83,30 @@ class TestIsVisionModel:
         assert is_vision_model("llama-2") is False
         assert is_vision_model("mistral-7b") is False
 
+    def test_provider_prefixed_and_mixed_case_names(self):
+        """Test matching ignores case and provider prefixes."""
+        assert is_vision_model("openai/GPT-4-Turbo") is True
+        assert is_vision_model("anthropic/Claude-Sonnet-4-5") is True
+        assert is_vision_model("vertex_ai/Gemini-1.5-Pro") is True
+        assert is_vision_model("gemini-flash") is False
+
+    def test_exact_names_agree_with_pattern(self):
+        """Test the exact-name fast path never disagrees with the pattern."""
+        for name in _VISION_MODEL_NAMES:
+            assert _VISION_MODEL_RE.search(name), name
+
+    def test_results_are_cached(self):
+        """Test repeated lookups for the same model are served from the cache."""
+        is_vision_model.cache_clear()
+
+        is_vision_model("gpt-4o")
+        is_vision_model("gpt-4o")
+        is_vision_model("gpt-4")
+
+        info = is_vision_model.cache_info()
+        assert info.hits == 1
+        assert info.misses == 2
+
 
 @pytest.mark.websocket
 class TestToolCallState:
@@ -203,6 +238,131 @@ class TestChatWebSocketHandler:
         assert result["updated_at"] is None
 
 
+@pytest.mark.websocket
+class TestConversationHistory:
+    """Test conversation history assembly from content blocks."""
+
+    @pytest.fixture
+    def make_history(self, db_session):
+        """Store a session's blocks in one batch and return an assembler for it."""
+
+        async def _make(blocks, model_name="gpt-4o"):
+            # Ids are assigned client-side, so tool results can point at their
+            # tool call without a flush, and everything is written in one commit
+            project = Project(id=str(uuid.uuid4()), name="History Project")
+            session = ChatSession(id=str(uuid.uuid4()), project_id=project.id, name="History")
+            entities = [project, session]
+            for seq, (block_type, author, content, metadata) in enumerate(blocks):
+                entities.append(
+                    ContentBlock(
+                        id=str(uuid.uuid4()),
+                        chat_session_id=session.id,
+                        sequence_number=seq,
+                        block_type=block_type,
+                        author=author,
+                        content=content,
+                        block_metadata=metadata,
+                    )
+                )
+            db_session.add_all(entities)
+            await db_session.commit()
+
+            handler = ChatWebSocketHandler(MagicMock(), db_session)
+            return await handler._get_conversation_history(session.id, model_name)
+
+        return _make
+
+    @pytest.mark.asyncio
+    async def test_conversation_history_text_only(self, make_history):
+        """Test user and assistant text become plain messages, skipping empty replies."""
+        history = await make_history(
+            [
+                (ContentBlockType.USER_TEXT, ContentBlockAuthor.USER, {"text": "Hi"}, {}),
+                (ContentBlockType.ASSISTANT_TEXT, ContentBlockAuthor.ASSISTANT, {"text": ""}, {}),
+                (
+                    ContentBlockType.ASSISTANT_TEXT,
+                    ContentBlockAuthor.ASSISTANT,
+                    {"text": "Hello!"},
+                    {},
+                ),
+            ]
+        )
+
+        assert history == [
+            {"role": "user", "content": "Hi"},
+            {"role": "assistant", "content": "Hello!"},
+        ]
+
+    @pytest.mark.asyncio
+    async def test_conversation_history_single_query(self, make_history, db_session):
+        """Test history is built from one SELECT without loading ORM blocks."""
+        statements = []
+
+        def _record(conn, cursor, statement, parameters, context, executemany):
+            if statement.lstrip().upper().startswith("SELECT"):
+                statements.append(statement)
+
+        sync_engine = db_session.bind.sync_engine
+        event.listen(sync_engine, "before_cursor_execute", _record)
+        try:
+            history = await make_history(
+                [
+                    (ContentBlockType.USER_TEXT, ContentBlockAuthor.USER, {"text": f"m{i}"}, {})
+                    for i in range(5)
+                ]
+            )
+        finally:
+            event.remove(sync_engine, "before_cursor_execute", _record)
+
+        assert len(history) == 5
+        assert len(statements) == 1
+
+    @pytest.mark.asyncio
+    async def test_conversation_history_mixed_text_and_images(self, make_history):
+        """Test image tool results use the vision format only for vision models."""
+        image_data = "data:image/png;base64,iVBORw0KGgo="
+        blocks = [
+            (ContentBlockType.USER_TEXT, ContentBlockAuthor.USER, {"text": "Plot it"}, {}),
+            (
+                ContentBlockType.TOOL_CALL,
+                ContentBlockAuthor.ASSISTANT,
+                {"tool_name": "file_read", "arguments": {"path": "/workspace/out/plot.png"}},
+                {},
+            ),
+            (
+                ContentBlockType.TOOL_RESULT,
+                ContentBlockAuthor.TOOL,
+                {"tool_name": "file_read", "result": "Image loaded", "success": True},
+                {"type": "image", "image_data": image_data},
+            ),
+            (
+                ContentBlockType.TOOL_RESULT,
+                ContentBlockAuthor.TOOL,
+                {"tool_name": "bash", "result": "boom", "success": False},
+                {},
+            ),
+        ]
+
+        history = await make_history(blocks, model_name="gpt-4o")
+
+        assert len(history) == 4
+        assert history[1]["function_call"] == {
+            "name": "file_read",
+            "arguments": '{"path": "/workspace/out/plot.png"}',
+        }
+        text_part, image_part = history[2]["content"]
+        assert text_part == {"type": "text", "text": "Tool result (file_read): Image loaded"}
+        assert image_part["image_url"]["url"].startswith("data:image/png;base64,")
+        assert history[3] == {"role": "user", "content": "Tool result (bash) [Error]: boom"}
+
+        history = await make_history(blocks, model_name="gpt-3.5-turbo")
+
+        assert history[2] == {
+            "role": "user",
+            "content": "Tool result (file_read) [Success]: Image loaded",
+        }
+
+
 @pytest.mark.websocket
 class TestChatWebSocketHandlerSequencing:
     """Test sequence number management."""
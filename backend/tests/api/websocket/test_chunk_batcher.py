@@ -0,0 +1,79 @@
+"""Tests for the ChunkBatcher module."""
+
+import pytest
+import asyncio
+
+from app.api.websocket.chunk_batcher import ChunkBatcher
+
+
+@pytest.fixture
+def sent():
+    """Collect the frames a batcher sends."""
+    return []
+
+
+@pytest.fixture
+def batcher(sent):
+    """Create a batcher with a long delay so only explicit triggers send."""
+
+    async def send(frame):
+        sent.append(frame)
+
+    return ChunkBatcher(send, max_bytes=10, max_delay=60)
+
+
+@pytest.mark.websocket
+class TestChunkBatcher:
+    """Test ChunkBatcher coalescing behavior."""
+
+    @pytest.mark.asyncio
+    async def test_flush_joins_chunks(self, batcher, sent):
+        """Test buffered chunks are sent as one frame on flush."""
+        await batcher.add("block-1", "Hel")
+        await batcher.add("block-1", "lo")
+        assert sent == []
+
+        await batcher.flush()
+
+        assert sent == [{"type": "chunk", "content": "Hello", "block_id": "block-1"}]
+
+    @pytest.mark.asyncio
+    async def test_flush_when_empty_sends_nothing(self, batcher, sent):
+        """Test flushing an empty batch is a no-op."""
+        await batcher.flush()
+        assert sent == []
+
+    @pytest.mark.asyncio
+    async def test_sends_when_max_bytes_reached(self, batcher, sent):
+        """Test a full batch is sent immediately."""
+        await batcher.add("block-1", "12345")
+        await batcher.add("block-1", "67890")
+
+        assert sent == [{"type": "chunk", "content": "1234567890", "block_id": "block-1"}]
+
+    @pytest.mark.asyncio
+    async def test_block_change_flushes_previous_block(self, batcher, sent):
+        """Test chunks for different blocks are never merged."""
+        await batcher.add("block-1", "a")
+        await batcher.add("block-2", "b")
+        await batcher.flush()
+
+        assert sent == [
+            {"type": "chunk", "content": "a", "block_id": "block-1"},
+            {"type": "chunk", "content": "b", "block_id": "block-2"},
+        ]
+
+    @pytest.mark.asyncio
+    async def test_sends_after_max_delay(self, sent):
+        """Test a partial batch is sent once the delay elapses."""
+
+        async def send(frame):
+            sent.append(frame)
+
+        batcher = ChunkBatcher(send, max_bytes=512, max_delay=0.01)
+        await batcher.add("block-1", "tok")
+        await batcher.add("block-1", "en")
+
+        await asyncio.sleep(0.05)
+
+        assert sent == [{"type": "chunk", "content": "token", "block_id": "block-1"}]
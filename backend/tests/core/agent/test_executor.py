@@ -2,7 +2,9 @@
 
 import pytest
 import asyncio
-from unittest.mock import AsyncMock, MagicMock
+from collections import defaultdict
+from operator import itemgetter
+from types import SimpleNamespace
 
 from app.core.agent.executor import ReActAgent, AgentStep, AgentResponse
 from app.core.agent.tools.base import Tool, ToolRegistry, ToolResult, ToolParameter
@@ -38,6 +40,41 @@ class MockTool(Tool):
         return self._result
 
 
+@pytest.fixture(scope="module")
+def shared_registry():
+    """Registry of default mock tools, shared by tests that don't need custom results.
+
+    Agents keep their own run state, so only the registry (and its cached
+    tool schemas) is shared; each test still builds its own ReActAgent.
+    """
+    registry = ToolRegistry()
+    for name in ("bash", "file_read"):
+        registry.register(MockTool(name=name))
+    return registry
+
+
+# Every agent event carries a "type" key
+_get_type = itemgetter("type")
+
+
+async def collect_events(agent, *args, first_idx: dict | None = None, **kwargs):
+    """
+    Run the agent and return its events, plus the same events bucketed by type.
+
+    If ``first_idx`` is given it is filled with the position of the first event
+    of each type, so ordering checks don't need ``events.index()`` scans.
+    """
+    events = []
+    by_type = defaultdict(list)
+    async for event in agent.run(*args, **kwargs):
+        event_type = _get_type(event)
+        if first_idx is not None and event_type not in first_idx:
+            first_idx[event_type] = len(events)
+        events.append(event)
+        by_type[event_type].append(event)
+    return events, by_type
+
+
 @pytest.mark.unit
 class TestAgentStep:
     """Test cases for AgentStep model."""
@@ -104,10 +141,17 @@ class TestReActAgent:
 
     @pytest.fixture
     def mock_llm_provider(self):
-        """Create a mock LLM provider."""
-        provider = MagicMock()
-        provider.generate_stream = AsyncMock()
-        return provider
+        """Create a stub LLM provider; tests replace generate_stream as needed.
+
+        A plain namespace instead of MagicMock: the agent only calls
+        generate_stream, and no test inspects calls on the provider.
+        """
+
+        async def generate_stream(**kwargs):
+            return
+            yield  # Make it a generator
+
+        return SimpleNamespace(generate_stream=generate_stream)
 
     @pytest.fixture
     def mock_tool_registry(self):
@@ -227,7 +271,7 @@ class TestReActAgent:
         assert should_proceed is False
         assert "file_read" in msg.lower()
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_run_simple_response(self, mock_llm_provider, mock_tool_registry):
         """Test run with simple text response (no tool call)."""
 
@@ -243,17 +287,15 @@ class TestReActAgent:
             tool_registry=mock_tool_registry,
         )
 
-        results = []
-        async for item in agent.run("Hello"):
-            results.append(item)
+        _, by_type = await collect_events(agent, "Hello")
 
         # Should have chunk events
-        chunk_events = [r for r in results if r["type"] == "chunk"]
+        chunk_events = by_type["chunk"]
         assert len(chunk_events) == 2
         assert chunk_events[0]["content"] == "Hello, "
         assert chunk_events[1]["content"] == "this is a response."
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_run_with_tool_call(self, mock_llm_provider):
         """Test run with tool execution."""
         registry = ToolRegistry()
@@ -283,20 +325,18 @@ class TestReActAgent:
             tool_registry=registry,
         )
 
-        results = []
-        async for item in agent.run("Run ls command"):
-            results.append(item)
+        _, by_type = await collect_events(agent, "Run ls command")
 
         # Should have action and observation events
-        action_events = [r for r in results if r["type"] == "action"]
-        observation_events = [r for r in results if r["type"] == "observation"]
+        action_events = by_type["action"]
+        observation_events = by_type["observation"]
 
         assert len(action_events) >= 1
         assert action_events[0]["tool"] == "bash"
         assert len(observation_events) >= 1
         assert observation_events[0]["success"] is True
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_run_with_cancellation(self, mock_llm_provider, mock_tool_registry):
         """Test run with cancellation event."""
         cancel_event = asyncio.Event()
@@ -314,22 +354,16 @@ class TestReActAgent:
             tool_registry=mock_tool_registry,
         )
 
-        results = []
-        async for item in agent.run("Hello", cancel_event=cancel_event):
-            results.append(item)
+        _, by_type = await collect_events(agent, "Hello", cancel_event=cancel_event)
 
         # Should have cancelled event
-        cancelled = [r for r in results if r["type"] == "cancelled"]
+        cancelled = by_type["cancelled"]
         assert len(cancelled) == 1
         assert "cancelled" in cancelled[0]["content"].lower()
 
-    @pytest.mark.asyncio
-    async def test_run_max_iterations(self, mock_llm_provider):
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_run_max_iterations(self, mock_llm_provider, shared_registry):
         """Test that agent respects max iterations."""
-        registry = ToolRegistry()
-        mock_tool = MockTool(name="bash")
-        registry.register(mock_tool)
-
         # Always return tool calls to force max iterations
         async def mock_generate_stream(**kwargs):
             yield {"function_call": {"name": "bash", "arguments": '{"input": "test"}'}}
@@ -338,20 +372,18 @@ class TestReActAgent:
 
         agent = ReActAgent(
             llm_provider=mock_llm_provider,
-            tool_registry=registry,
+            tool_registry=shared_registry,
             max_iterations=2,
         )
 
-        results = []
-        async for item in agent.run("Run forever"):
-            results.append(item)
+        _, by_type = await collect_events(agent, "Run forever")
 
         # Should have final answer about max iterations
-        final = [r for r in results if r.get("type") == "final_answer"]
+        final = by_type["final_answer"]
         assert len(final) == 1
         assert "maximum iterations" in final[0]["content"].lower()
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_run_with_conversation_history(self, mock_llm_provider, mock_tool_registry):
         """Test run with conversation history."""
 
@@ -373,13 +405,11 @@ class TestReActAgent:
             {"role": "assistant", "content": "Previous response"},
         ]
 
-        results = []
-        async for item in agent.run("Follow up", conversation_history=history):
-            results.append(item)
+        results, _ = await collect_events(agent, "Follow up", conversation_history=history)
 
         assert len(results) > 0
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_run_with_llm_error(self, mock_llm_provider, mock_tool_registry):
         """Test run handles LLM errors gracefully."""
 
@@ -394,15 +424,13 @@ class TestReActAgent:
             tool_registry=mock_tool_registry,
         )
 
-        results = []
-        async for item in agent.run("Hello"):
-            results.append(item)
+        _, by_type = await collect_events(agent, "Hello")
 
-        error_events = [r for r in results if r["type"] == "error"]
+        error_events = by_type["error"]
         assert len(error_events) == 1
         assert "LLM API Error" in error_events[0]["content"]
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_run_tool_validation_error(self, mock_llm_provider):
         """Test handling of tool validation errors."""
         registry = ToolRegistry()
@@ -435,15 +463,13 @@ class TestReActAgent:
             max_validation_retries=3,
         )
 
-        results = []
-        async for item in agent.run("Run something"):
-            results.append(item)
+        _, by_type = await collect_events(agent, "Run something")
 
         # Should NOT have action events for validation errors
-        action_events = [r for r in results if r["type"] == "action"]
+        action_events = by_type["action"]
         assert len(action_events) == 0
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_run_tool_loop_detection(self, mock_llm_provider):
         """Test detection of tool call loops."""
         registry = ToolRegistry()
@@ -472,14 +498,12 @@ class TestReActAgent:
             max_iterations=10,
         )
 
-        results = []
-        async for item in agent.run("Keep trying"):
-            results.append(item)
+        await collect_events(agent, "Keep trying")
 
         # Agent should detect loop and suggest different approach
         # The tool history should be cleared after loop detection
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_run_edit_validation(self, mock_llm_provider):
         """Test that edit_lines requires file_read first."""
         registry = ToolRegistry()
@@ -497,20 +521,14 @@ class TestReActAgent:
             max_iterations=2,
         )
 
-        results = []
-        async for item in agent.run("Edit the file"):
-            results.append(item)
+        await collect_events(agent, "Edit the file")
 
         # Should not have action events since validation should fail
         # The agent should continue to next iteration
 
-    @pytest.mark.asyncio
-    async def test_streaming_action_events(self, mock_llm_provider):
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_streaming_action_events(self, mock_llm_provider, shared_registry):
         """Test action streaming events are emitted."""
-        registry = ToolRegistry()
-        mock_tool = MockTool(name="bash")
-        registry.register(mock_tool)
-
         call_count = 0
 
         async def mock_generate_stream(**kwargs):
@@ -528,27 +546,84 @@ class TestReActAgent:
 
         agent = ReActAgent(
             llm_provider=mock_llm_provider,
-            tool_registry=registry,
+            tool_registry=shared_registry,
         )
 
-        results = []
-        async for item in agent.run("Run command"):
-            results.append(item)
+        first_idx = {}
+        _, by_type = await collect_events(agent, "Run command", first_idx=first_idx)
 
         # Should have action_streaming event
-        streaming_events = [r for r in results if r["type"] == "action_streaming"]
+        streaming_events = by_type["action_streaming"]
         assert len(streaming_events) >= 1
         assert streaming_events[0]["tool"] == "bash"
 
-    @pytest.mark.asyncio
-    async def test_multiple_tool_calls_uses_first(self, mock_llm_provider):
-        """Test that only first tool call is executed per iteration."""
-        registry = ToolRegistry()
-        tool1 = MockTool(name="bash")
-        tool2 = MockTool(name="file_read")
-        registry.register(tool1)
-        registry.register(tool2)
+        # Streaming starts before the complete action is announced
+        assert first_idx["action_streaming"] < first_idx["action"]
 
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_repeated_tool_name_streams_once(self, mock_llm_provider, shared_registry):
+        """Test a tool name repeated on the same index is announced only once."""
+        call_count = 0
+
+        async def mock_generate_stream(**kwargs):
+            nonlocal call_count
+            call_count += 1
+            if call_count == 1:
+                yield {"function_call": {"name": "bash", "arguments": '{"inpu'}}
+                yield {"function_call": {"name": "bash", "arguments": 't": "ls"}'}}
+            else:
+                yield "Done"
+
+        mock_llm_provider.generate_stream = mock_generate_stream
+
+        agent = ReActAgent(
+            llm_provider=mock_llm_provider,
+            tool_registry=shared_registry,
+        )
+
+        _, by_type = await collect_events(agent, "Run command")
+
+        assert len(by_type["action_streaming"]) == 1
+        assert by_type["action_args_chunk"][-1]["partial_args"] == '{"input": "ls"}'
+        assert by_type["action"][0]["args"] == {"input": "ls"}
+
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_batched_action_streaming(self, mock_llm_provider, shared_registry):
+        """Test back-to-back tool announcements are coalesced when batching is on."""
+        call_count = 0
+
+        async def mock_generate_stream(**kwargs):
+            nonlocal call_count
+            call_count += 1
+            if call_count == 1:
+                yield {"function_call": {"name": "bash", "arguments": ""}, "index": 0}
+                yield {"function_call": {"name": "file_read", "arguments": ""}, "index": 1}
+                yield {"function_call": {"name": None, "arguments": '{"input": "ls"}'}, "index": 0}
+                yield {"function_call": {"name": None, "arguments": '{"path": "/t"}'}, "index": 1}
+            else:
+                yield "Done"
+
+        mock_llm_provider.generate_stream = mock_generate_stream
+
+        agent = ReActAgent(
+            llm_provider=mock_llm_provider,
+            tool_registry=shared_registry,
+            batch_action_streaming=True,
+        )
+
+        first_idx = {}
+        _, by_type = await collect_events(agent, "Do things", first_idx=first_idx)
+
+        streaming_events = by_type["action_streaming"]
+        assert len(streaming_events) == 1
+        assert streaming_events[0]["tool"] == "bash"
+        assert streaming_events[0]["tools"] == [{"tool": "bash"}, {"tool": "file_read"}]
+        assert first_idx["action_streaming"] < first_idx["action_args_chunk"]
+        assert by_type["action"][0]["tool"] == "bash"
+
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_multiple_tool_calls_uses_first(self, mock_llm_provider, shared_registry):
+        """Test that only first tool call is executed per iteration."""
         call_count = 0
 
         async def mock_generate_stream(**kwargs):
@@ -571,14 +646,12 @@ class TestReActAgent:
 
         agent = ReActAgent(
             llm_provider=mock_llm_provider,
-            tool_registry=registry,
+            tool_registry=shared_registry,
         )
 
-        results = []
-        async for item in agent.run("Do things"):
-            results.append(item)
+        _, by_type = await collect_events(agent, "Do things")
 
         # Should only execute the first tool
-        action_events = [r for r in results if r["type"] == "action"]
+        action_events = by_type["action"]
         assert len(action_events) == 1
         assert action_events[0]["tool"] == "bash"
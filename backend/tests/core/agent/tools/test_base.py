@@ -1,6 +1,7 @@
 """Tests for base Tool classes and ToolRegistry."""
 
 import pytest
+from unittest.mock import patch
 from pydantic import BaseModel, Field
 
 from app.core.agent.tools.base import (
@@ -322,3 +323,26 @@ class TestToolRegistry:
             assert tool_def["type"] == "function"
             assert "function" in tool_def
             assert "name" in tool_def["function"]
+
+    def test_get_tools_for_llm_cached_until_registry_changes(self):
+        """Test tool schemas are built once and rebuilt after register/unregister."""
+        registry = ToolRegistry()
+        tool = MockTool()
+        registry.register(tool)
+
+        with patch.object(MockTool, "format_for_llm", wraps=tool.format_for_llm) as fmt:
+            first = registry.get_tools_for_llm()
+            second = registry.get_tools_for_llm()
+            assert fmt.call_count == 1
+            assert first == second
+            assert first[0] is second[0]
+
+            # Callers get their own list
+            second.append({"type": "function"})
+            assert len(registry.get_tools_for_llm()) == 1
+
+            registry.register(MockToolWithSchema())
+            assert len(registry.get_tools_for_llm()) == 2
+
+            registry.unregister("mock_schema_tool")
+            assert [t["function"]["name"] for t in registry.get_tools_for_llm()] == ["mock_tool"]
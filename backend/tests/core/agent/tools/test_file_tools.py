@@ -3,10 +3,25 @@
 import pytest
 from unittest.mock import AsyncMock
 
-from app.core.agent.tools.file_tools import FileReadTool, FileWriteTool
+from app.core.agent.tools.file_tools import FileReadTool, FileWriteTool, _data_uri_mime_type
 from app.core.sandbox.container import SandboxContainer
 
 
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "data_uri, expected",
+    [
+        ("data:image/png;base64,iVBORw0KGgo=", "image/png"),
+        ("data:text/plain,hello;world", "text/plain"),
+        ("data:;base64,AAAA", "application/octet-stream"),
+        ("data:application/octet-stream", "application/octet-stream"),
+    ],
+)
+def test_data_uri_mime_type(data_uri, expected):
+    """Test the MIME type is read from the header only, with a fallback."""
+    assert _data_uri_mime_type(data_uri) == expected
+
+
 @pytest.mark.unit
 class TestFileReadTool:
     """Test cases for FileReadTool."""
@@ -69,6 +84,20 @@ class TestFileReadTool:
         assert result.metadata["is_binary"] is True
         assert result.metadata["type"] == "image"
         assert "image_data" in result.metadata
+        assert result.metadata["mime_type"] == "image/png"
+        assert result.metadata["filename"] == "plot.png"
+
+    @pytest.mark.asyncio
+    async def test_read_image_file_keeps_data_uri_by_reference(self, mock_container):
+        """Test the image data URI is stored as-is rather than rebuilt."""
+        data_uri = "data:image/jpeg;base64," + "A" * 4096
+        mock_container.read_file.return_value = data_uri
+        tool = FileReadTool(mock_container)
+
+        result = await tool.execute(path="/workspace/out/photo.jpg")
+
+        assert result.metadata["image_data"] is data_uri
+        assert result.metadata["mime_type"] == "image/jpeg"
 
     @pytest.mark.asyncio
     async def test_read_video_file(self, mock_container):
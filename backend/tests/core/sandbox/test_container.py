@@ -4,6 +4,7 @@ import pytest
 from unittest.mock import MagicMock
 
 from app.core.sandbox.container import SandboxContainer
+from app.core.storage.workspace_storage import ChunkReader
 
 
 @pytest.mark.unit
@@ -144,6 +145,68 @@ class TestSandboxContainer:
 
         assert result == "print('Hello, World!')"
 
+    @pytest.mark.asyncio
+    async def test_read_file_bytes_binary(self, mock_docker_container):
+        """Test reading raw bytes skips the base64 data URI encoding."""
+        import io
+        import tarfile
+
+        tar_bytes = io.BytesIO()
+        tar = tarfile.open(fileobj=tar_bytes, mode="w")
+        content = b"\x89PNG\r\n\x1a\n\xff\xfe"
+        tarinfo = tarfile.TarInfo(name="plot.png")
+        tarinfo.size = len(content)
+        tar.addfile(tarinfo, io.BytesIO(content))
+        tar.close()
+
+        def get_archive_mock(path):
+            return iter([tar_bytes.getvalue()]), {"name": "plot.png"}
+
+        mock_docker_container.get_archive = get_archive_mock
+        container = SandboxContainer(mock_docker_container, "/tmp/ws")
+
+        assert await container.read_file_bytes("/workspace/out/plot.png") == content
+        assert (await container.read_file("/workspace/out/plot.png")).startswith(
+            "data:image/png;base64,"
+        )
+
+    def test_chunk_reader_reads_across_chunks(self):
+        """Test reads smaller and larger than a chunk return the bytes in order."""
+        reader = ChunkReader([b"abcdef", b"", b"gh", b"ijklmnop"])
+
+        assert reader.read(4) == b"abcd"
+        assert reader.read(4) == b"ef"
+        assert reader.read(5) == b"gh"
+        assert reader.read(100) == b"ijklmnop"
+        assert reader.read(1) == b""
+
+    def test_iter_directory_files(self, mock_docker_container):
+        """Test a directory is read from one archive, skipping nested entries."""
+        import io
+        import tarfile
+
+        tar_bytes = io.BytesIO()
+        tar = tarfile.open(fileobj=tar_bytes, mode="w")
+        tar.addfile(tarfile.TarInfo(name="out"), None)
+        for name, content in [("out/a.txt", b"alpha"), ("out/sub/b.txt", b"nested")]:
+            tarinfo = tarfile.TarInfo(name=name)
+            tarinfo.size = len(content)
+            tar.addfile(tarinfo, io.BytesIO(content))
+        tar.close()
+        data = tar_bytes.getvalue()
+
+        # Deliver the archive in small chunks, as the Docker API does
+        mock_docker_container.get_archive.return_value = (
+            (data[i : i + 100] for i in range(0, len(data), 100)),
+            {"name": "out"},
+        )
+        container = SandboxContainer(mock_docker_container, "/tmp/ws")
+
+        files = list(container.iter_directory_files("/workspace/out"))
+
+        assert files == [("a.txt", b"alpha")]
+        mock_docker_container.get_archive.assert_called_once_with("/workspace/out")
+
     @pytest.mark.asyncio
     async def test_read_file_not_found(self, mock_docker_container):
         """Test read_file raises exception for missing file."""
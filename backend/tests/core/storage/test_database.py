@@ -0,0 +1,31 @@
+"""Tests for database engine setup."""
+
+import pytest
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.core.config import settings
+from app.core.storage.database import _pool_options
+
+
+@pytest.mark.unit
+class TestPoolOptions:
+    """Test cases for connection pool sizing."""
+
+    @pytest.mark.parametrize(
+        "url",
+        [
+            "sqlite+aiosqlite://",
+            "sqlite+aiosqlite:///:memory:",
+        ],
+    )
+    def test_in_memory_sqlite_has_no_pool_sizing(self, url):
+        """Test in-memory SQLite URLs get no pool sizing, which StaticPool rejects."""
+        assert _pool_options(url) == {}
+        create_async_engine(url, **_pool_options(url)).sync_engine.dispose()
+
+    def test_file_sqlite_is_sized(self):
+        """Test file-backed databases get the configured pool size."""
+        options = _pool_options("sqlite+aiosqlite:///./data/app.db")
+
+        assert options["pool_size"] == settings.database_pool_size
+        assert options["max_overflow"] == settings.database_max_overflow
@@ -98,6 +98,28 @@ class TestLocalStorage:
         with pytest.raises(FileNotFoundError):
             await storage.read_file(session_id, "/workspace/out/missing.py")
 
+    @pytest.mark.asyncio
+    async def test_open_file_streams_chunks(self, storage, session_id):
+        """Test a file is streamed back in chunks of at most chunk_size, with its size."""
+        await storage.create_workspace(session_id)
+        content = b"0123456789" * 10
+        await storage.write_file(session_id, "/workspace/out/data.bin", content)
+
+        stream = await storage.open_file(session_id, "/workspace/out/data.bin", chunk_size=32)
+        chunks = [chunk async for chunk in stream]
+
+        assert stream.size == len(content)
+        assert b"".join(chunks) == content
+        assert [len(c) for c in chunks] == [32, 32, 32, 4]
+
+    @pytest.mark.asyncio
+    async def test_open_file_not_found(self, storage, session_id):
+        """Test a missing file fails when opened, before any iteration."""
+        await storage.create_workspace(session_id)
+
+        with pytest.raises(FileNotFoundError):
+            await storage.open_file(session_id, "/workspace/out/missing.py")
+
     @pytest.mark.asyncio
     async def test_file_exists(self, storage, session_id):
         """Test checking file existence."""
@@ -0,0 +1,44 @@
+"""Tests for the storage factory."""
+
+import pytest
+from unittest.mock import patch
+
+import app.core.storage.storage_factory as module
+from app.core.storage.local_storage import LocalStorage
+from app.core.storage.storage_factory import create_storage, get_storage
+
+
+@pytest.mark.unit
+class TestStorageFactory:
+    """Test cases for storage backend selection and caching."""
+
+    def test_create_local_storage(self, temp_workspace):
+        """Test local mode creates a LocalStorage backend."""
+        with patch.object(module.settings, "storage_workspace_base", str(temp_workspace)):
+            storage = create_storage(mode="local")
+
+        assert isinstance(storage, LocalStorage)
+
+    def test_create_invalid_mode(self):
+        """Test an unknown mode is rejected."""
+        with pytest.raises(ValueError, match="Invalid storage mode"):
+            create_storage(mode="ftp")
+
+    def test_get_storage_returns_singleton(self, temp_workspace):
+        """Test get_storage builds the backend once and reuses it for every request."""
+        original = module._storage_instance
+        module._storage_instance = None
+
+        try:
+            with (
+                patch.object(module.settings, "storage_mode", "local"),
+                patch.object(module.settings, "storage_workspace_base", str(temp_workspace)),
+                patch.object(module, "create_storage", wraps=module.create_storage) as create,
+            ):
+                storage1 = get_storage()
+                storage2 = get_storage()
+
+            assert storage1 is storage2
+            create.assert_called_once()
+        finally:
+            module._storage_instance = original
@@ -0,0 +1,64 @@
+"""Tests for VolumeStorage backend."""
+
+import io
+import tarfile
+import pytest
+from unittest.mock import MagicMock
+
+from app.core.storage.volume_storage import VolumeStorage
+
+
+def _tar_chunks(name: str, content: bytes, chunk_size: int = 100):
+    """Build a one-file tar archive and split it like a Docker archive response."""
+    tar_bytes = io.BytesIO()
+    with tarfile.open(fileobj=tar_bytes, mode="w") as tar:
+        tarinfo = tarfile.TarInfo(name=name)
+        tarinfo.size = len(content)
+        tar.addfile(tarinfo, io.BytesIO(content))
+    data = tar_bytes.getvalue()
+    return (data[i : i + chunk_size] for i in range(0, len(data), chunk_size))
+
+
+@pytest.mark.unit
+class TestVolumeStorage:
+    """Test cases for VolumeStorage."""
+
+    @pytest.fixture
+    def helper_container(self):
+        """Mock helper container started to reach the volume."""
+        return MagicMock()
+
+    @pytest.fixture
+    def storage(self, helper_container):
+        """Create a VolumeStorage with a mock Docker client."""
+        docker_client = MagicMock()
+        docker_client.containers.run.return_value = helper_container
+        return VolumeStorage(docker_client=docker_client)
+
+    @pytest.mark.asyncio
+    async def test_open_file_streams_archive(self, storage, helper_container):
+        """Test a file is streamed from the archive and the helper removed afterwards."""
+        content = b"0123456789" * 10
+        helper_container.get_archive.return_value = (_tar_chunks("data.bin", content), {})
+
+        stream = await storage.open_file("session-1", "/workspace/out/data.bin", chunk_size=32)
+
+        assert stream.size == len(content)
+        helper_container.remove.assert_not_called()
+
+        chunks = [chunk async for chunk in stream]
+
+        assert b"".join(chunks) == content
+        assert [len(c) for c in chunks] == [32, 32, 32, 4]
+        helper_container.get_archive.assert_called_once_with("/workspace/out/data.bin")
+        helper_container.remove.assert_called_once_with(force=True)
+
+    @pytest.mark.asyncio
+    async def test_open_file_not_found(self, storage, helper_container):
+        """Test a missing file fails when opened and the helper is removed."""
+        helper_container.get_archive.side_effect = Exception("404 Client Error: No such file")
+
+        with pytest.raises(FileNotFoundError):
+            await storage.open_file("session-1", "/workspace/out/missing.bin")
+
+        helper_container.remove.assert_called_once_with(force=True)
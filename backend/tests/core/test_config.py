@@ -17,10 +17,13 @@ class TestSettings:
             settings = Settings()
 
             assert settings.database_url == "sqlite+aiosqlite:///./data/open-claude-pilot.db"
+            assert settings.database_pool_size == 20
+            assert settings.database_max_overflow == 0
             assert settings.host == "127.0.0.1"
             assert settings.port == 8000
             assert settings.docker_container_pool_size == 5
             assert settings.storage_mode == "volume"
+            assert settings.agent_batch_action_streaming is False
             assert settings.default_llm_provider == "openai"
             assert settings.default_llm_model == "gpt-5-mini"
 
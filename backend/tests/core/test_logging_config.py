@@ -0,0 +1,48 @@
+"""Tests for application logging setup."""
+
+import logging
+import pytest
+
+from app.core.logging_config import start_logging, stop_logging
+
+
+@pytest.mark.unit
+class TestLoggingConfig:
+    """Test cases for queue-based logging."""
+
+    @pytest.fixture
+    def app_logger(self):
+        """Give the app logger a known state and restore it afterwards."""
+        logger = logging.getLogger("app")
+        original = (logger.level, logger.propagate, list(logger.handlers))
+        logger.setLevel(logging.WARNING)
+        logger.propagate = False
+        yield logger
+        stop_logging()
+        logger.setLevel(original[0])
+        logger.propagate = original[1]
+        logger.handlers[:] = original[2]
+
+    def test_records_reach_stderr(self, app_logger, capsys):
+        """Test app records are written to stderr once stop_logging flushes the queue."""
+        start_logging("DEBUG")
+        # Calling again must not install a second handler
+        start_logging("DEBUG")
+        logging.getLogger("app.api.routes.chat").debug("hello %s", "world")
+        stop_logging()
+
+        lines = capsys.readouterr().err.splitlines()
+        assert len(lines) == 1
+        assert lines[0].endswith("DEBUG [app.api.routes.chat] hello world")
+
+    def test_stop_restores_logger_state(self, app_logger):
+        """Test stop_logging puts back the level, propagate flag and handlers."""
+        handlers = list(app_logger.handlers)
+
+        start_logging("DEBUG")
+        assert app_logger.level == logging.DEBUG
+        stop_logging()
+
+        assert app_logger.level == logging.WARNING
+        assert app_logger.propagate is False
+        assert app_logger.handlers == handlers
@@ -1,8 +1,9 @@
 """Tests for ContentBlock database model."""
 
 import pytest
-from sqlalchemy import select
+from sqlalchemy import select, inspect, text
 
+from app.core.storage.database import _create_missing_indexes
 from app.models.database import ContentBlock
 from app.models.database.content_block import ContentBlockType, ContentBlockAuthor
 
@@ -141,6 +142,12 @@ class TestContentBlockModel:
 
         assert tool_result.parent_block_id == tool_call.id
 
+        # Relationship directions load explicitly in async sessions
+        await db_session.refresh(tool_call, ["children"])
+        await db_session.refresh(tool_result, ["parent"])
+        assert tool_result.parent is tool_call
+        assert tool_call.children == [tool_result]
+
     @pytest.mark.asyncio
     async def test_block_metadata(self, db_session, sample_chat_session):
         """Test block_metadata field."""
@@ -217,3 +224,24 @@ class TestContentBlockModel:
         assert ContentBlockAuthor.ASSISTANT.value == "assistant"
         assert ContentBlockAuthor.SYSTEM.value == "system"
         assert ContentBlockAuthor.TOOL.value == "tool"
+
+    @pytest.mark.asyncio
+    async def test_session_sequence_index(self, async_engine):
+        """Test the listing index exists and is restored on existing tables."""
+
+        def index_columns(connection):
+            return {
+                index["name"]: index["column_names"]
+                for index in inspect(connection).get_indexes("content_blocks")
+            }
+
+        async with async_engine.begin() as conn:
+            indexes = await conn.run_sync(index_columns)
+            assert indexes["ix_content_blocks_session_seq"] == [
+                "chat_session_id",
+                "sequence_number",
+            ]
+
+            await conn.execute(text("DROP INDEX ix_content_blocks_session_seq"))
+            await conn.run_sync(_create_missing_indexes)
+            assert "ix_content_blocks_session_seq" in await conn.run_sync(index_columns)
@@ -122,6 +122,24 @@ class TestChatSessionSchemas:
         assert response.id == "mock-session-id"
         assert response.status == ChatSessionStatus.ACTIVE
 
+    def test_chat_session_response_from_orm_fast(self):
+        """Test from_orm_fast matches model_validate for a DB row."""
+
+        class MockSession:
+            id = "mock-session-id"
+            project_id = "mock-project-id"
+            name = "Mock Session"
+            created_at = datetime.utcnow()
+            updated_at = datetime.utcnow()
+            container_id = None
+            status = ChatSessionStatus.ACTIVE
+            environment_type = "python3.13"
+
+        row = MockSession()
+        fast = ChatSessionResponse.from_orm_fast(row)
+        assert fast == ChatSessionResponse.model_validate(row)
+        assert fast.model_dump(mode="json")["status"] == "active"
+
     def test_chat_session_list_response(self):
         """Test ChatSessionListResponse schema."""
         now = datetime.utcnow()
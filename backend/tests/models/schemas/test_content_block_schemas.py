@@ -96,6 +96,27 @@ class TestContentBlockSchemas:
         assert response.sequence_number == 1
         assert response.block_type == ContentBlockType.USER_TEXT
 
+    def test_content_block_response_from_orm_fast(self):
+        """Test from_orm_fast matches model_validate for a DB row."""
+        now = datetime.utcnow()
+
+        class MockBlock:
+            id = "block-id"
+            chat_session_id = "session-id"
+            sequence_number = 3
+            block_type = ContentBlockType.TOOL_CALL
+            author = ContentBlockAuthor.ASSISTANT
+            content = {"tool_name": "bash", "arguments": {}}
+            parent_block_id = None
+            block_metadata = {"streaming": False}
+            created_at = now
+            updated_at = now
+
+        row = MockBlock()
+        fast = ContentBlockResponse.from_orm_fast(row)
+        assert fast == ContentBlockResponse.model_validate(row)
+        assert fast.model_dump(mode="json")["block_type"] == "tool_call"
+
     def test_content_block_list_response(self):
         """Test ContentBlockListResponse schema."""
         now = datetime.utcnow()
@@ -136,8 +136,8 @@ class TestEventBus:
         bus.subscribe(StreamingEvent.START, handler)
         await bus.emit(StreamingEvent.START, {"message_id": "123"})
 
-        # Wait for event processing
-        await asyncio.sleep(0.1)
+        # Yield once so the background processor task drains the queue
+        await asyncio.sleep(0)
 
         handler.assert_called_once()
         call_args = handler.call_args[0][0]
@@ -154,7 +154,7 @@ class TestEventBus:
         bus.subscribe(StreamingEvent.CHUNK, handler2)
 
         await bus.emit(StreamingEvent.CHUNK, {"content": "test"})
-        await asyncio.sleep(0.1)
+        await asyncio.sleep(0)
 
         handler1.assert_called_once()
         handler2.assert_called_once()
@@ -167,7 +167,7 @@ class TestEventBus:
 
         bus.subscribe(StreamingEvent.END, handler)
         await bus.emit(StreamingEvent.END, {"status": "complete"})
-        await asyncio.sleep(0.1)
+        await asyncio.sleep(0)
 
         handler.assert_called_once()
 
@@ -178,7 +178,7 @@ class TestEventBus:
 
         await bus.emit(StreamingEvent.START, {"id": "1"})
         await bus.emit(StreamingEvent.CHUNK, {"id": "2"})
-        await asyncio.sleep(0.1)
+        await asyncio.sleep(0)
 
         history = bus.get_history()
         assert len(history) == 2
@@ -248,7 +248,8 @@ class TestEventBus:
         bus = EventBus()
 
         async def emit_later():
-            await asyncio.sleep(0.1)
+            # The waiter subscribes before it suspends, so one yield is enough
+            await asyncio.sleep(0)
             await bus.emit(StreamingEvent.END, {"status": "done"})
 
         asyncio.create_task(emit_later())
@@ -270,14 +270,17 @@ export const useOptimizedStreaming = ({
         break;
 
       case 'action_streaming':
-        // Real-time feedback when tool name is first received
-        eventBufferRef.current.push({
-          type: 'action_streaming',
-          content: `Preparing ${data.tool}...`,
-          tool: data.tool,
-          status: data.status,
-          step: data.step,
-        });
+        // Real-time feedback when tool name is first received. A batched event
+        // lists several tools; expand it so each one gets its own entry.
+        for (const { tool } of data.tools ?? [{ tool: data.tool }]) {
+          eventBufferRef.current.push({
+            type: 'action_streaming',
+            content: `Preparing ${tool}...`,
+            tool,
+            status: data.status,
+            step: data.step,
+          });
+        }
         break;
 
       case 'action_args_chunk':
@@ -9,6 +9,7 @@ export interface ChatMessage {
   step?: number;
   partial_content?: string;
   status?: string;  // For action_streaming status
+  tools?: { tool: string }[];  // For batched action_streaming events
 }
 
 export class ChatWebSocket {
@@ -84,6 +84,7 @@ export interface ContentBlock {
 export interface ContentBlockListResponse {
   blocks: ContentBlock[];
   total: number;
+  next_after_seq?: number | null;
 }
 
 // Content payload structures for different block types